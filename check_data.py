@@ -2,8 +2,16 @@
 import sqlite3
 from datetime import datetime
 
-conn = sqlite3.connect('data/database.sqlite')
+conn = sqlite3.connect('data/database.sqlite', cached_statements=128)
 conn.row_factory = sqlite3.Row
+
+# Read-friendly pragmas: WAL allows reads concurrent with the monitor's
+# writes, and mmap lets the OS page cache serve repeat scans.
+conn.execute("PRAGMA journal_mode=WAL")
+conn.execute("PRAGMA synchronous=NORMAL")
+conn.execute("PRAGMA temp_store=MEMORY")
+conn.execute("PRAGMA mmap_size=268435456")
+
 cursor = conn.cursor()
 
 print("=" * 60)
@@ -52,35 +60,48 @@ for row in cursor.fetchall():
     time = row['time']
     print(f"{row['track_id']:<8} {row['direction_code']:<10} {class_name:<12} {conf:<6} {backend:<8} {time}")
 
-# Check class breakdown
-print("\n🎯 Class Breakdown:")
+# Class and backend breakdowns fused into one statement: a single tagged
+# UNION ALL over two CTEs replaces two separate round-trips/statement
+# compiles (SQLite has no GROUPING SETS, so the tag column stands in).
 cursor.execute("""
-    SELECT 
-        COALESCE(class_name, 'NULL') as class_name,
-        COUNT(*) as count,
-        ROUND(AVG(confidence), 3) as avg_conf
-    FROM count_events
-    GROUP BY class_name
-    ORDER BY count DESC
+    WITH class_agg AS (
+        SELECT
+            COALESCE(class_name, 'NULL') as key,
+            COUNT(*) as count,
+            ROUND(AVG(confidence), 3) as avg_conf
+        FROM count_events
+        GROUP BY class_name
+    ),
+    backend_agg AS (
+        SELECT
+            detection_backend as key,
+            COUNT(*) as count,
+            NULL as avg_conf
+        FROM count_events
+        GROUP BY detection_backend
+    )
+    SELECT 'class' as kind, key, count, avg_conf FROM class_agg
+    UNION ALL
+    SELECT 'backend' as kind, key, count, avg_conf FROM backend_agg
+    ORDER BY kind, count DESC
 """)
 
+class_rows = []
+backend_rows = []
+for row in cursor.fetchall():
+    (class_rows if row['kind'] == 'class' else backend_rows).append(row)
+
+# Check class breakdown
+print("\n🎯 Class Breakdown:")
 print(f"{'Class':<15} {'Count':<8} {'Avg Confidence'}")
 print("-" * 40)
-for row in cursor.fetchall():
-    print(f"{row['class_name']:<15} {row['count']:<8} {row['avg_conf']:.3f}")
+for row in class_rows:
+    print(f"{row['key']:<15} {row['count']:<8} {row['avg_conf']:.3f}")
 
 # Check detection backend
 print("\n🔧 Detection Backend:")
-cursor.execute("""
-    SELECT 
-        detection_backend,
-        COUNT(*) as count
-    FROM count_events
-    GROUP BY detection_backend
-""")
-
-for row in cursor.fetchall():
-    print(f"   {row['detection_backend']}: {row['count']} events")
+for row in backend_rows:
+    print(f"   {row['key']}: {row['count']} events")
 
 # Check platform metadata
 print("\n💻 Platform Metadata:")
@@ -1,7 +1,15 @@
 import sqlite3
 
-conn = sqlite3.connect('data/database.sqlite')
+conn = sqlite3.connect('data/database.sqlite', cached_statements=128)
 conn.row_factory = sqlite3.Row
+
+# Read-friendly pragmas: WAL allows reads concurrent with the monitor's
+# writes, and mmap lets the OS page cache serve repeat scans.
+conn.execute("PRAGMA journal_mode=WAL")
+conn.execute("PRAGMA synchronous=NORMAL")
+conn.execute("PRAGMA temp_store=MEMORY")
+conn.execute("PRAGMA mmap_size=268435456")
+
 cursor = conn.cursor()
 
 # Schema version
@@ -12,7 +12,11 @@ Available counters:
 from .base import Counter, CounterConfig, DIRECTION_A_TO_B, DIRECTION_B_TO_A
 from .line import LineCounter, LineCounterConfig, create_line_counter_from_config
 from .gate import GateCounter, GateCounterConfig, create_gate_counter_from_config
-from .utils import compute_counting_line
+from .utils import (
+    compute_counting_line,
+    compute_counting_line_cached,
+    compute_counting_lines_batch,
+)
 
 __all__ = [
     "Counter",
@@ -26,5 +30,7 @@ __all__ = [
     "GateCounterConfig",
     "create_gate_counter_from_config",
     "compute_counting_line",
+    "compute_counting_line_cached",
+    "compute_counting_lines_batch",
 ]
 
@@ -0,0 +1,201 @@
+"""
+Optional Numba-accelerated geometry kernels for counting algorithms.
+
+Numba is not a required dependency (it is heavy to install on a Raspberry
+Pi), so everything here degrades gracefully: when Numba is missing,
+`crossed_line_batch` is None and callers fall back to their NumPy paths.
+
+Install with `pip install numba` to enable the JIT kernels.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True)
+    def crossed_line_batch(
+        prevs: np.ndarray,
+        currs: np.ndarray,
+        ax: float,
+        ay: float,
+        bx: float,
+        by: float,
+        cached_s1: np.ndarray,
+    ):
+        """
+        JIT-compiled crossing test for N track steps against one line.
+
+        Semantics match gate.crossed_line exactly: a step crosses when its
+        endpoints lie strictly on opposite sides of the line and the line
+        endpoints lie on opposite (or touching) sides of the step.
+
+        Args:
+            prevs: (N, 2) float64 array of previous positions.
+            currs: (N, 2) float64 array of current positions.
+            ax, ay, bx, by: Line endpoints as scalars (Numba-friendly).
+            cached_s1: (N,) side signs for prevs, NaN where unknown.
+
+        Returns:
+            Tuple of ((N,) bool crossing mask, (N,) side signs for currs).
+        """
+        n = prevs.shape[0]
+        mask = np.zeros(n, dtype=np.bool_)
+        s2 = np.empty(n, dtype=np.float64)
+        dx = bx - ax
+        dy = by - ay
+        for i in range(n):
+            px = prevs[i, 0]
+            py = prevs[i, 1]
+            cx = currs[i, 0]
+            cy = currs[i, 1]
+            s2i = dx * (cy - ay) - dy * (cx - ax)
+            s2[i] = s2i
+            s1i = cached_s1[i]
+            if np.isnan(s1i):
+                s1i = dx * (py - ay) - dy * (px - ax)
+            if ((s1i < 0.0) != (s2i < 0.0)) and s1i != 0.0 and s2i != 0.0:
+                sx = cx - px
+                sy = cy - py
+                o1 = sx * (ay - py) - sy * (ax - px)
+                o2 = sx * (by - py) - sy * (bx - px)
+                if o1 * o2 <= 0:
+                    mask[i] = True
+        return mask, s2
+
+    @njit(cache=True)
+    def crossed_two_lines_batch(
+        prevs: np.ndarray,
+        currs: np.ndarray,
+        axa: float,
+        aya: float,
+        bxa: float,
+        bya: float,
+        axb: float,
+        ayb: float,
+        bxb: float,
+        byb: float,
+        cached_s1a: np.ndarray,
+        cached_s1b: np.ndarray,
+    ):
+        """
+        Fused crossing test for N track steps against both gate lines.
+
+        Equivalent to two crossed_line_batch calls, but loads each step's
+        endpoints and computes its direction vector once, sharing them
+        between the line A and line B tests.
+
+        Args:
+            prevs: (N, 2) float64 array of previous positions.
+            currs: (N, 2) float64 array of current positions.
+            axa..bya: Line A endpoints as scalars.
+            axb..byb: Line B endpoints as scalars.
+            cached_s1a: (N,) side signs for prevs vs line A, NaN where unknown.
+            cached_s1b: (N,) side signs for prevs vs line B, NaN where unknown.
+
+        Returns:
+            Tuple of (mask_a, s2a, mask_b, s2b).
+        """
+        n = prevs.shape[0]
+        mask_a = np.zeros(n, dtype=np.bool_)
+        mask_b = np.zeros(n, dtype=np.bool_)
+        s2a = np.empty(n, dtype=np.float64)
+        s2b = np.empty(n, dtype=np.float64)
+        dxa = bxa - axa
+        dya = bya - aya
+        dxb = bxb - axb
+        dyb = byb - ayb
+        for i in range(n):
+            px = prevs[i, 0]
+            py = prevs[i, 1]
+            cx = currs[i, 0]
+            cy = currs[i, 1]
+            sx = cx - px
+            sy = cy - py
+
+            s2ai = dxa * (cy - aya) - dya * (cx - axa)
+            s2a[i] = s2ai
+            s1ai = cached_s1a[i]
+            if np.isnan(s1ai):
+                s1ai = dxa * (py - aya) - dya * (px - axa)
+            if ((s1ai < 0.0) != (s2ai < 0.0)) and s1ai != 0.0 and s2ai != 0.0:
+                o1 = sx * (aya - py) - sy * (axa - px)
+                o2 = sx * (bya - py) - sy * (bxa - px)
+                if o1 * o2 <= 0:
+                    mask_a[i] = True
+
+            s2bi = dxb * (cy - ayb) - dyb * (cx - axb)
+            s2b[i] = s2bi
+            s1bi = cached_s1b[i]
+            if np.isnan(s1bi):
+                s1bi = dxb * (py - ayb) - dyb * (px - axb)
+            if ((s1bi < 0.0) != (s2bi < 0.0)) and s1bi != 0.0 and s2bi != 0.0:
+                o1 = sx * (ayb - py) - sy * (axb - px)
+                o2 = sx * (byb - py) - sy * (bxb - px)
+                if o1 * o2 <= 0:
+                    mask_b[i] = True
+        return mask_a, s2a, mask_b, s2b
+
+    @njit(cache=True)
+    def crossed_line_dir_batch(
+        prevs: np.ndarray,
+        currs: np.ndarray,
+        ax: float,
+        ay: float,
+        bx: float,
+        by: float,
+        full_span: bool,
+    ):
+        """
+        JIT-compiled directional crossing test for N track steps.
+
+        Semantics match line.crossed_line exactly, with the direction string
+        encoded as a sign: +1 for "positive" (crossed from the negative side),
+        -1 for "negative", 0 for no crossing.
+
+        Args:
+            prevs: (N, 2) float64 array of previous positions.
+            currs: (N, 2) float64 array of current positions.
+            ax, ay, bx, by: Line endpoints as scalars (Numba-friendly).
+            full_span: When True the line spans the full frame, so a sign
+                flip alone guarantees a crossing and the segment test is
+                skipped.
+
+        Returns:
+            (N,) int8 array of direction codes.
+        """
+        n = prevs.shape[0]
+        dirs = np.zeros(n, dtype=np.int8)
+        dx = bx - ax
+        dy = by - ay
+        for i in range(n):
+            px = prevs[i, 0]
+            py = prevs[i, 1]
+            cx = currs[i, 0]
+            cy = currs[i, 1]
+            s1 = dx * (py - ay) - dy * (px - ax)
+            s2 = dx * (cy - ay) - dy * (cx - ax)
+            if ((s1 < 0.0) != (s2 < 0.0)) and s1 != 0.0 and s2 != 0.0:
+                if full_span:
+                    dirs[i] = 1 if s1 < 0 else -1
+                else:
+                    sx = cx - px
+                    sy = cy - py
+                    o1 = sx * (ay - py) - sy * (ax - px)
+                    o2 = sx * (by - py) - sy * (bx - px)
+                    if o1 * o2 <= 0:
+                        dirs[i] = 1 if s1 < 0 else -1
+        return dirs
+
+else:
+    crossed_line_batch = None
+    crossed_two_lines_batch = None
+    crossed_line_dir_batch = None
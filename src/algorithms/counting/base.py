@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, List, Sequence, Set, Tuple
 
 from models.count_event import CountEvent
 
@@ -85,7 +85,7 @@ class Counter(ABC):
         self._counted_track_ids.clear()
 
     @abstractmethod
-    def process(self, tracks: List[Any], frame_idx: int) -> List[CountEvent]:
+    def process(self, tracks: List[Any], frame_idx: int) -> Sequence[CountEvent]:
         """
         Process tracks and produce count events.
         
@@ -101,7 +101,9 @@ class Counter(ABC):
             frame_idx: Current frame index for timing information.
             
         Returns:
-            List of CountEvent objects for tracks that crossed in this frame.
+            Sequence of CountEvent objects for tracks that crossed in this
+            frame. May be an immutable (possibly shared) empty sequence;
+            callers must not mutate it.
         """
         pass
 
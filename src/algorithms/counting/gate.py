@@ -8,44 +8,43 @@ Each track is counted only once.
 
 from __future__ import annotations
 
+import logging
 import math
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from models.count_event import CountEvent
 from .base import Counter, CounterConfig
+from ._geom import (
+    crossed_line_batch as _jit_crossed_line_batch,
+    crossed_two_lines_batch as _jit_crossed_two_lines_batch,
+)
+from .geometry import _segments_intersect, _side_of_line
 
 
-def _side_of_line(p: Tuple[float, float], a: Tuple[int, int], b: Tuple[int, int]) -> float:
-    """Signed area (cross product) to determine which side of a->b the point lies on."""
-    return (b[0] - a[0]) * (p[1] - a[1]) - (b[1] - a[1]) * (p[0] - a[0])
-
-
-def _segments_intersect(
-    p1: Tuple[float, float], 
-    p2: Tuple[float, float], 
-    a: Tuple[int, int], 
-    b: Tuple[int, int]
-) -> bool:
-    """Check if segment p1->p2 intersects with segment a->b (inclusive)."""
-    def orient(x, y, z):
-        return (y[0] - x[0]) * (z[1] - x[1]) - (y[1] - x[1]) * (z[0] - x[0])
-
-    o1 = orient(p1, p2, a)
-    o2 = orient(p1, p2, b)
-    o3 = orient(a, b, p1)
-    o4 = orient(a, b, p2)
-
-    if o1 == 0 and o2 == 0 and o3 == 0 and o4 == 0:
-        return False  # colinear overlap not expected; treat as no crossing
+# Padding around the gate lines' bounding box; tracks farther away than this
+# cannot reach either line within a single frame step.
+_GATE_BBOX_PADDING_PX = 50.0
 
-    return (o1 * o2 <= 0) and (o3 * o4 <= 0)
+# Codes for _GateTrackState.last_crossed_line: int compares are cheaper than
+# string compares in the per-track crossing bookkeeping.
+_LINE_NONE = 0
+_LINE_A = 1
+_LINE_B = 2
 
+# Self-cleanup of per-track state: every interval, drop states not updated
+# for the stale threshold. Guards long-running processes against unbounded
+# growth if the external cleanup_stale_tracks() caller is missing.
+_STATE_CLEANUP_INTERVAL_FRAMES = 300
+_STATE_STALE_AFTER_FRAMES = 600
 
-def _distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
-    """Euclidean distance between two points."""
-    return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
+# Shared immutable result for frames that produce no events (the vast
+# majority); avoids allocating a fresh empty list 30 times a second.
+# Callers only iterate the result, so the tuple/list difference is benign.
+_EMPTY_EVENTS: Tuple[CountEvent, ...] = ()
 
 
 def crossed_line(
@@ -76,6 +75,60 @@ def crossed_line(
     return _segments_intersect(prev, curr, p1, p2)
 
 
+def _batch_crossed_line(
+    prevs: np.ndarray,
+    currs: np.ndarray,
+    line: np.ndarray,
+    cached_s1: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized equivalent of crossed_line() for N track steps at once.
+
+    Args:
+        prevs: (N, 2) array of previous positions.
+        currs: (N, 2) array of current positions.
+        line: (2, 2) float64 array of line endpoints.
+        cached_s1: Optional (N,) array of previously computed side signs for
+            `prevs` (NaN where unknown). The previous frame's curr-side is this
+            frame's prev-side, so callers can reuse it and skip half the work.
+
+    Returns:
+        Tuple of ((N,) boolean crossing mask, (N,) side signs for currs).
+        The side signs can be cached by the caller for the next frame.
+    """
+    if _jit_crossed_line_batch is not None:
+        if cached_s1 is None:
+            cached_s1 = np.full(prevs.shape[0], np.nan)
+        return _jit_crossed_line_batch(
+            prevs, currs, line[0, 0], line[0, 1], line[1, 0], line[1, 1], cached_s1
+        )
+
+    a = line[0]
+    b = line[1]
+    d = b - a
+
+    # Side of the line for each endpoint (same cross product as _side_of_line)
+    s2 = d[0] * (currs[:, 1] - a[1]) - d[1] * (currs[:, 0] - a[0])
+    if cached_s1 is None:
+        s1 = d[0] * (prevs[:, 1] - a[1]) - d[1] * (prevs[:, 0] - a[0])
+    else:
+        s1 = cached_s1
+        missing = np.isnan(s1)
+        if missing.any():
+            p = prevs[missing]
+            s1 = s1.copy()
+            s1[missing] = d[0] * (p[:, 1] - a[1]) - d[1] * (p[:, 0] - a[0])
+
+    # Orientation of the line endpoints relative to each step segment
+    step = currs - prevs
+    o1 = step[:, 0] * (a[1] - prevs[:, 1]) - step[:, 1] * (a[0] - prevs[:, 0])
+    o2 = step[:, 0] * (b[1] - prevs[:, 1]) - step[:, 1] * (b[0] - prevs[:, 0])
+
+    # Matches crossed_line: endpoints strictly on opposite sides of the line,
+    # and the line endpoints on opposite (or touching) sides of the step.
+    return (s1 * s2 < 0) & (o1 * o2 <= 0), s2
+
+
 @dataclass
 class GateCounterConfig(CounterConfig):
     """
@@ -95,15 +148,26 @@ class GateCounterConfig(CounterConfig):
     min_displacement_px: float = 15.0
 
 
-@dataclass
+@dataclass(slots=True)
 class _GateTrackState:
-    """Internal state for tracking gate crossings per track."""
+    """Internal state for tracking gate crossings per track.
+
+    Slotted: one instance lives per active track, so dropping the per-instance
+    __dict__ meaningfully shrinks memory on busy scenes.
+    """
     first_frame: int
     first_pos: Tuple[float, float]
-    last_crossed_line: Optional[str] = None  # "A" or "B"
+    last_crossed_line: int = _LINE_NONE  # _LINE_A or _LINE_B
     last_crossed_frame: Optional[int] = None
     line_a_frame: Optional[int] = None
     line_b_frame: Optional[int] = None
+    # Side-sign cache: the position the cached signs were computed at, and the
+    # signed side of each gate line at that position (reused as next frame's s1).
+    last_pos: Optional[Tuple[float, float]] = None
+    last_side_a: float = math.nan
+    last_side_b: float = math.nan
+    # Frame the state was last touched, for periodic self-cleanup
+    last_update_frame: int = 0
 
 
 class GateCounter(Counter):
@@ -126,12 +190,57 @@ class GateCounter(Counter):
         super().__init__(config)
         self._gate_config = config
         self._track_states: Dict[int, _GateTrackState] = {}
-        
+        self._last_cleanup_frame = 0
+
+        # Gate geometry never changes after construction; pre-convert the
+        # endpoints once so the per-frame kernel skips list->array conversion.
+        self._line_a_np = self._line_as_array(config.line_a)
+        self._line_b_np = self._line_as_array(config.line_b)
+
+        # Bounding box around both gate lines, padded by the largest step a
+        # track can plausibly take in one frame. Tracks outside it cannot
+        # cross either line this frame and are skipped up front.
+        self._gate_bbox = self._compute_gate_bbox(
+            config.line_a, config.line_b, padding=_GATE_BBOX_PADDING_PX
+        )
+
+        # Constraint scalars resolved once: the checks run per completed
+        # sequence and should not pay property/config dispatch each time
+        self._min_displacement_sq = config.min_displacement_px ** 2
+        self._min_age_frames = config.min_age_frames
+        self._max_gap_frames = config.max_gap_frames
+
         # Platform metadata (set via set_metadata())
         self._detection_backend = "unknown"
         self._platform = None
         self._process_pid = None
 
+    @staticmethod
+    def _compute_gate_bbox(
+        line_a: List[Tuple[int, int]],
+        line_b: List[Tuple[int, int]],
+        padding: float,
+    ) -> Optional[Tuple[float, float, float, float]]:
+        """Padded (xmin, ymin, xmax, ymax) around both gate lines, if valid."""
+        points = list(line_a or []) + list(line_b or [])
+        if len(points) != 4:
+            return None
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        return (
+            min(xs) - padding,
+            min(ys) - padding,
+            max(xs) + padding,
+            max(ys) + padding,
+        )
+
+    @staticmethod
+    def _line_as_array(line: List[Tuple[int, int]]) -> Optional[np.ndarray]:
+        """Pre-convert a line's endpoints to a (2, 2) float64 array, if valid."""
+        if line and len(line) == 2:
+            return np.asarray(line, dtype=np.float64)
+        return None
+
     @property
     def line_a(self) -> List[Tuple[int, int]]:
         """Gate line A."""
@@ -166,7 +275,7 @@ class GateCounter(Counter):
             lines.append((self.line_b[0], self.line_b[1]))
         return lines
 
-    def process(self, tracks: List[Any], frame_idx: int) -> List[CountEvent]:
+    def process(self, tracks: List[Any], frame_idx: int) -> Sequence[CountEvent]:
         """
         Process tracks and detect gate crossings.
         
@@ -179,106 +288,207 @@ class GateCounter(Counter):
             frame_idx: Current frame index.
             
         Returns:
-            List of CountEvent for tracks that completed a gate crossing.
+            Sequence of CountEvent for tracks that completed a gate
+            crossing; empty frames share an immutable empty tuple, so
+            callers must not mutate the result.
         """
-        events: List[CountEvent] = []
-        
         # Validate lines exist
         if not self.line_a or not self.line_b:
-            return events
+            return _EMPTY_EVENTS
         if len(self.line_a) != 2 or len(self.line_b) != 2:
-            return events
-
+            return _EMPTY_EVENTS
+
+        # Periodic self-cleanup so _track_states stays bounded even when the
+        # external cleanup_stale_tracks() caller is absent
+        if frame_idx - self._last_cleanup_frame >= _STATE_CLEANUP_INTERVAL_FRAMES:
+            self._last_cleanup_frame = frame_idx
+            stale = [
+                track_id
+                for track_id, st in self._track_states.items()
+                if frame_idx - st.last_update_frame > _STATE_STALE_AFTER_FRAMES
+            ]
+            for track_id in stale:
+                del self._track_states[track_id]
+
+        if not tracks:
+            return _EMPTY_EVENTS
+
+        # Gather candidate tracks (uncounted, with enough trajectory) and
+        # their last two positions into (N, 2) arrays so both line tests run
+        # as single vectorized passes instead of per-track Python geometry.
+        candidates = []
+        endpoints = []
+        cached_a_list = []
+        cached_b_list = []
+        states = self._track_states
+        gate_bbox = self._gate_bbox
+        # Direct set membership: skips a bound-method call per track per frame
+        counted = self._counted_track_ids
         for track in tracks:
-            event = self._process_track(track, frame_idx)
+            trajectory = track.trajectory
+            if track.vehicle_id in counted or len(trajectory) < 2:
+                continue
+            prev = trajectory[-2]
+            curr = trajectory[-1]
+            # State is created as soon as a track qualifies (even far from the
+            # gate) so first_frame/first_pos keep their original meaning for
+            # the age and displacement constraints.
+            st = states.get(track.vehicle_id)
+            if st is None:
+                st = states[track.vehicle_id] = _GateTrackState(
+                    first_frame=frame_idx,
+                    first_pos=trajectory[0],
+                )
+            st.last_update_frame = frame_idx
+            # Skip tracks too far from the gate to cross either line this
+            # frame; tracks mid-sequence stay monitored regardless.
+            if gate_bbox is not None and st.last_crossed_line == _LINE_NONE:
+                if (
+                    curr[0] < gate_bbox[0]
+                    or curr[1] < gate_bbox[1]
+                    or curr[0] > gate_bbox[2]
+                    or curr[1] > gate_bbox[3]
+                ):
+                    continue
+            candidates.append(track)
+            endpoints.append(prev)
+            endpoints.append(curr)
+            # Reuse last frame's curr-side as this frame's prev-side when the
+            # trajectory advanced exactly one point since we last saw it.
+            if st.last_pos == prev:
+                cached_a_list.append(st.last_side_a)
+                cached_b_list.append(st.last_side_b)
+            else:
+                cached_a_list.append(math.nan)
+                cached_b_list.append(math.nan)
+
+        if not candidates:
+            return _EMPTY_EVENTS
+
+        points = np.asarray(endpoints, dtype=np.float64).reshape(-1, 2, 2)
+        prevs = points[:, 0, :]
+        currs = points[:, 1, :]
+
+        if _jit_crossed_two_lines_batch is not None:
+            # Fused kernel shares each step's endpoint loads and direction
+            # vector between the two line tests
+            la = self._line_a_np
+            lb = self._line_b_np
+            crossed_a, sides_a, crossed_b, sides_b = _jit_crossed_two_lines_batch(
+                prevs, currs,
+                la[0, 0], la[0, 1], la[1, 0], la[1, 1],
+                lb[0, 0], lb[0, 1], lb[1, 0], lb[1, 1],
+                np.asarray(cached_a_list), np.asarray(cached_b_list),
+            )
+        else:
+            crossed_a, sides_a = _batch_crossed_line(
+                prevs, currs, self._line_a_np, np.asarray(cached_a_list)
+            )
+            crossed_b, sides_b = _batch_crossed_line(
+                prevs, currs, self._line_b_np, np.asarray(cached_b_list)
+            )
+
+        # One clock read per frame; every event this frame shares it
+        now = time.time()
+
+        # Event list allocated only once a crossing actually completes
+        events: Optional[List[CountEvent]] = None
+        for i, track in enumerate(candidates):
+            event = self._process_track(
+                track, frame_idx, bool(crossed_a[i]), bool(crossed_b[i]), now
+            )
             if event is not None:
+                if events is None:
+                    events = []
                 events.append(event)
-        
-        return events
-
-    def _process_track(self, track: Any, frame_idx: int) -> Optional[CountEvent]:
-        """Process a single track for gate crossing."""
+            # Cache this frame's curr-side signs for reuse next frame
+            st = states.get(track.vehicle_id)
+            if st is not None:
+                st.last_pos = track.trajectory[-1]
+                st.last_side_a = sides_a[i]
+                st.last_side_b = sides_b[i]
+
+        return events if events is not None else _EMPTY_EVENTS
+
+    def _process_track(
+        self,
+        track: Any,
+        frame_idx: int,
+        crossed_a: bool,
+        crossed_b: bool,
+        now: float,
+    ) -> Optional[CountEvent]:
+        """Process a single track given its precomputed line-crossing flags."""
         track_id = track.vehicle_id
-        trajectory = list(track.trajectory)
-        
-        # Skip if already counted
-        if self.is_counted(track_id):
-            return None
-        
-        # Need at least 2 trajectory points to detect crossing
-        if len(trajectory) < 2:
-            return None
-        
-        # Get or create track state
-        if track_id not in self._track_states:
-            self._track_states[track_id] = _GateTrackState(
-                first_frame=frame_idx,
-                first_pos=trajectory[0],
-            )
+
+        # State was created by process() before the track became a candidate
         st = self._track_states[track_id]
-        
-        # Get last two positions for crossing detection
-        prev = trajectory[-2]
-        curr = trajectory[-1]
-        
-        # Check for line crossings this frame
-        crossed_a = crossed_line(prev, curr, self.line_a)
-        crossed_b = crossed_line(prev, curr, self.line_b)
-        
+
+        # Current position for displacement check
+        curr = track.trajectory[-1]
+
         # Determine if we completed a gate sequence
         sequence = self._update_crossing_state(st, crossed_a, crossed_b, frame_idx)
         
         if sequence is None:
             return None
         
-        # Validate constraints
+        # Validate constraints (squared displacement defers the sqrt until
+        # an event is actually emitted)
         age_frames = frame_idx - st.first_frame + 1
-        displacement = _distance(st.first_pos, curr)
-        
+        dx = curr[0] - st.first_pos[0]
+        dy = curr[1] - st.first_pos[1]
+        displacement_sq = dx * dx + dy * dy
+
         # Check gap constraint (time since first line crossing)
         first_line_frame = st.line_a_frame if sequence == "A_TO_B" else st.line_b_frame
         second_line_frame = st.line_b_frame if sequence == "A_TO_B" else st.line_a_frame
         gap = second_line_frame - first_line_frame if first_line_frame and second_line_frame else 0
-        
-        if age_frames < self.min_age_frames:
+
+        if age_frames < self._min_age_frames:
             return None
-        if displacement < self.min_displacement_px:
+        if displacement_sq < self._min_displacement_sq:
             return None
-        if gap > self.max_gap_frames:
+        if gap > self._max_gap_frames:
             # Reset state - crossing took too long
-            st.last_crossed_line = None
+            st.last_crossed_line = _LINE_NONE
             st.last_crossed_frame = None
             return None
-        
+
+        displacement = math.sqrt(displacement_sq)
+
         # Get direction label
         direction_label = self.direction_labels.get(
             "a_to_b" if sequence == "A_TO_B" else "b_to_a",
             sequence,
         )
         
-        # Extract detection metadata from track
-        class_id = getattr(track, 'class_id', None)
-        class_name = getattr(track, 'class_name', None)
-        confidence = getattr(track, 'confidence', 1.0)
+        # Detection metadata: every track type (TrackedVehicle, Track)
+        # declares these fields with defaults, so plain attribute access
+        # replaces the getattr-with-default triple
+        class_id = track.class_id
+        class_name = track.class_name
+        confidence = track.confidence
         
-        # Create count event
+        # Create count event (positional, in CountEvent field order: skips
+        # per-event keyword binding for the long argument list)
         event = CountEvent(
-            track_id=track_id,
-            direction=sequence,
-            direction_label=direction_label,
-            timestamp=time.time(),
-            counting_mode="gate",
-            gate_sequence=sequence,
-            line_a_cross_frame=st.line_a_frame,
-            line_b_cross_frame=st.line_b_frame,
-            track_age_frames=age_frames,
-            track_displacement_px=displacement,
-            class_id=class_id,
-            class_name=class_name,
-            confidence=confidence,
-            detection_backend=getattr(self, '_detection_backend', 'unknown'),
-            platform=getattr(self, '_platform', None),
-            process_pid=getattr(self, '_process_pid', None),
+            track_id,                # track_id
+            sequence,                # direction
+            direction_label,         # direction_label
+            now,                     # timestamp
+            "gate",                  # counting_mode
+            sequence,                # gate_sequence
+            st.line_a_frame,         # line_a_cross_frame
+            st.line_b_frame,         # line_b_cross_frame
+            age_frames,              # track_age_frames
+            displacement,            # track_displacement_px
+            class_id,
+            class_name,
+            confidence,
+            self._detection_backend,
+            self._platform,
+            self._process_pid,
         )
         
         # Mark as counted in counter's internal state
@@ -291,10 +501,10 @@ class GateCounter(Counter):
         if hasattr(track, 'direction'):
             track.direction = sequence
         
-        import logging
+        # %-style args defer string formatting until a handler accepts the record
         logging.info(
-            f"[COUNT] track_id={track_id} direction={sequence} "
-            f"frame={frame_idx} age={age_frames} displacement={displacement:.1f}px"
+            "[COUNT] track_id=%s direction=%s frame=%d age=%d displacement=%.1fpx",
+            track_id, sequence, frame_idx, age_frames, displacement,
         )
         
         return event
@@ -316,22 +526,22 @@ class GateCounter(Counter):
         
         if crossed_a:
             st.line_a_frame = frame_idx
-            if st.last_crossed_line == "B":
+            if st.last_crossed_line == _LINE_B:
                 # Crossed B first, now crossing A -> B_TO_A
                 sequence = "B_TO_A"
             else:
                 # First line crossed or was A before
-                st.last_crossed_line = "A"
+                st.last_crossed_line = _LINE_A
                 st.last_crossed_frame = frame_idx
         
         if crossed_b and sequence is None:
             st.line_b_frame = frame_idx
-            if st.last_crossed_line == "A":
+            if st.last_crossed_line == _LINE_A:
                 # Crossed A first, now crossing B -> A_TO_B
                 sequence = "A_TO_B"
             else:
                 # First line crossed or was B before
-                st.last_crossed_line = "B"
+                st.last_crossed_line = _LINE_B
                 st.last_crossed_frame = frame_idx
         
         return sequence
@@ -376,13 +586,13 @@ def create_gate_counter_from_config(
         frame_width: Frame width for ratio-to-pixel conversion.
         frame_height: Frame height for ratio-to-pixel conversion.
     """
-    from algorithms.counting.utils import compute_counting_line
+    from algorithms.counting.utils import compute_counting_line_cached
     
     line_a_cfg = counting_cfg.get("line_a")
     line_b_cfg = counting_cfg.get("line_b")
     
-    line_a = compute_counting_line(line_a_cfg, frame_width, frame_height) if line_a_cfg else []
-    line_b = compute_counting_line(line_b_cfg, frame_width, frame_height) if line_b_cfg else []
+    line_a = compute_counting_line_cached(line_a_cfg, frame_width, frame_height) if line_a_cfg else []
+    line_b = compute_counting_line_cached(line_b_cfg, frame_width, frame_height) if line_b_cfg else []
     
     direction_labels = counting_cfg.get("direction_labels", {}) or {
         "a_to_b": "northbound",
@@ -0,0 +1,55 @@
+"""
+Shared scalar geometry helpers for counting algorithms.
+
+Both line and gate counting need the same side-of-line, segment
+intersection, and distance primitives; they live here once so a single
+optimized implementation (and any future kernel work) benefits every
+counter. The underscore names are kept for compatibility with the
+counters' historical module-level helpers.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Tuple
+
+
+def _side_of_line(p: Tuple[float, float], a: Tuple[int, int], b: Tuple[int, int]) -> float:
+    """Signed area (cross product) to determine which side of a->b the point lies on."""
+    return (b[0] - a[0]) * (p[1] - a[1]) - (b[1] - a[1]) * (p[0] - a[0])
+
+
+def _segments_intersect(
+    p1: Tuple[float, float],
+    p2: Tuple[float, float],
+    a: Tuple[int, int],
+    b: Tuple[int, int]
+) -> bool:
+    """Check if segment p1->p2 intersects with segment a->b (inclusive)."""
+    # Cheap AABB reject: most track steps are short and nowhere near the
+    # line, so four compares avoid the eight multiplies below.
+    if (
+        max(p1[0], p2[0]) < min(a[0], b[0])
+        or min(p1[0], p2[0]) > max(a[0], b[0])
+        or max(p1[1], p2[1]) < min(a[1], b[1])
+        or min(p1[1], p2[1]) > max(a[1], b[1])
+    ):
+        return False
+
+    def orient(x, y, z):
+        return (y[0] - x[0]) * (z[1] - x[1]) - (y[1] - x[1]) * (z[0] - x[0])
+
+    o1 = orient(p1, p2, a)
+    o2 = orient(p1, p2, b)
+    o3 = orient(a, b, p1)
+    o4 = orient(a, b, p2)
+
+    if o1 == 0 and o2 == 0 and o3 == 0 and o4 == 0:
+        return False  # colinear overlap not expected; treat as no crossing
+
+    return (o1 * o2 <= 0) and (o3 * o4 <= 0)
+
+
+def _distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
+    """Euclidean distance between two points."""
+    return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
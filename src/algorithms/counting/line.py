@@ -15,48 +15,26 @@ import time
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from models.count_event import CountEvent
 from .base import Counter, CounterConfig
+from ._geom import crossed_line_dir_batch as _jit_crossed_line_dir_batch
+from .geometry import _segments_intersect, _side_of_line
 
 
-# Direction code mapping: line crossing side -> standard direction code
-# "positive" (crossed from - to + side) maps to A_TO_B
-# "negative" (crossed from + to - side) maps to B_TO_A
-_DIRECTION_CODE_MAP = {
-    "positive": "A_TO_B",
-    "negative": "B_TO_A",
-}
-
-
-def _side_of_line(p: Tuple[float, float], a: Tuple[int, int], b: Tuple[int, int]) -> float:
-    """Signed area (cross product) to determine which side of a->b the point lies on."""
-    return (b[0] - a[0]) * (p[1] - a[1]) - (b[1] - a[1]) * (p[0] - a[0])
-
-
-def _segments_intersect(
-    p1: Tuple[float, float], 
-    p2: Tuple[float, float], 
-    a: Tuple[int, int], 
-    b: Tuple[int, int]
-) -> bool:
-    """Check if segment p1->p2 intersects with segment a->b (inclusive)."""
-    def orient(x, y, z):
-        return (y[0] - x[0]) * (z[1] - x[1]) - (y[1] - x[1]) * (z[0] - x[0])
-
-    o1 = orient(p1, p2, a)
-    o2 = orient(p1, p2, b)
-    o3 = orient(a, b, p1)
-    o4 = orient(a, b, p2)
-
-    if o1 == 0 and o2 == 0 and o3 == 0 and o4 == 0:
-        return False  # colinear overlap not expected; treat as no crossing
-
-    return (o1 * o2 <= 0) and (o3 * o4 <= 0)
+# Padding around the counting line's bounding box; tracks farther away than
+# this cannot reach the line within a single frame step.
+_LINE_BBOX_PADDING_PX = 50.0
 
+# Every interval, drop per-track state whose track is no longer live so the
+# dict stays bounded by concurrent tracks instead of growing for hours.
+_STATE_CLEANUP_INTERVAL_FRAMES = 300
 
-def _distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
-    """Euclidean distance between two points."""
-    return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
+# Direction codes indexed by crossing sign: index 1 ("positive", crossed
+# from - to + side) maps to A_TO_B, index 0 ("negative") to B_TO_A.
+# Tuple indexing by the sign test skips a per-event string + dict lookup.
+_DIR_FROM_SIGN = ("B_TO_A", "A_TO_B")
 
 
 def crossed_line(
@@ -86,6 +64,55 @@ def crossed_line(
     return "positive" if s1 < 0 else "negative"
 
 
+def _batch_crossed_line_dir(
+    prevs: np.ndarray,
+    currs: np.ndarray,
+    line: np.ndarray,
+    full_span: bool = False,
+) -> np.ndarray:
+    """
+    Vectorized equivalent of crossed_line() for N track steps at once.
+
+    Args:
+        prevs: (N, 2) array of previous positions.
+        currs: (N, 2) array of current positions.
+        line: (2, 2) float64 array of line endpoints.
+        full_span: True when the line spans the full frame width, in which
+            case a sign flip alone guarantees a crossing and the
+            segment-intersection test is skipped.
+
+    Returns:
+        (N,) int8 array: +1 where the step crossed from the negative side
+        ("positive"), -1 where it crossed from the positive side ("negative"),
+        0 where it did not cross.
+    """
+    if _jit_crossed_line_dir_batch is not None:
+        return _jit_crossed_line_dir_batch(
+            prevs, currs, line[0, 0], line[0, 1], line[1, 0], line[1, 1], full_span
+        )
+
+    a = line[0]
+    b = line[1]
+    d = b - a
+
+    # Side of the line for each endpoint (same cross product as _side_of_line)
+    s1 = d[0] * (prevs[:, 1] - a[1]) - d[1] * (prevs[:, 0] - a[0])
+    s2 = d[0] * (currs[:, 1] - a[1]) - d[1] * (currs[:, 0] - a[0])
+
+    crossed = s1 * s2 < 0
+    if not full_span:
+        # Orientation of the line endpoints relative to each step segment
+        step = currs - prevs
+        o1 = step[:, 0] * (a[1] - prevs[:, 1]) - step[:, 1] * (a[0] - prevs[:, 0])
+        o2 = step[:, 0] * (b[1] - prevs[:, 1]) - step[:, 1] * (b[0] - prevs[:, 0])
+        # Matches crossed_line: endpoints strictly on opposite sides of the
+        # line, and the line endpoints on opposite (or touching) sides of
+        # the step.
+        crossed &= o1 * o2 <= 0
+
+    return np.where(crossed, np.where(s1 < 0, 1, -1), 0).astype(np.int8)
+
+
 @dataclass
 class LineCounterConfig(CounterConfig):
     """
@@ -95,15 +122,22 @@ class LineCounterConfig(CounterConfig):
         line: Counting line as [(x1,y1), (x2,y2)] in pixels.
         min_age_frames: Min track age (frames) before counting.
         min_displacement_px: Min displacement (pixels) for valid count.
+        frame_width: Frame width in pixels (0 if unknown). Lets the counter
+            detect lines spanning the full frame and skip the segment test.
     """
     line: List[Tuple[int, int]] = field(default_factory=list)
     min_age_frames: int = 3
     min_displacement_px: float = 15.0
+    frame_width: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class _LineTrackState:
-    """Internal state for tracking line crossings per track."""
+    """Internal state for tracking line crossings per track.
+
+    Slotted: one instance lives per active track, so dropping the
+    per-instance __dict__ shrinks memory and speeds attribute access.
+    """
     first_frame: int
     first_pos: Tuple[float, float]
 
@@ -127,7 +161,60 @@ class LineCounter(Counter):
         super().__init__(config)
         self._line_config = config
         self._track_states: Dict[int, _LineTrackState] = {}
-        
+        self._last_cleanup_frame = 0
+
+        # Line geometry never changes after construction; pre-convert the
+        # endpoints once so the per-frame kernel skips list->array conversion.
+        if config.line and len(config.line) == 2:
+            self._line_np: Optional[np.ndarray] = np.asarray(config.line, dtype=np.float64)
+            # Padded bounding box around the line: tracks outside it cannot
+            # cross this frame and are skipped before the batch kernel.
+            (x1, y1), (x2, y2) = config.line
+            pad = _LINE_BBOX_PADDING_PX
+            self._line_bbox: Optional[Tuple[float, float, float, float]] = (
+                min(x1, x2) - pad,
+                min(y1, y2) - pad,
+                max(x1, x2) + pad,
+                max(y1, y2) + pad,
+            )
+        else:
+            self._line_np = None
+            self._line_bbox = None
+
+        # Lines generated from a Y ratio span the full frame width; any step
+        # inside the frame with a side-sign flip must then cross the line, so
+        # the per-step segment-intersection test can be skipped entirely.
+        self._full_span = bool(
+            self._line_np is not None
+            and config.frame_width > 0
+            and {config.line[0][0], config.line[1][0]} == {0, config.frame_width}
+        )
+
+        # Horizontal full-span lines (the default, generated from a Y ratio)
+        # reduce the whole crossing test to two Y comparisons: the side sign
+        # is dx*(y - line_y) with dx > 0, so only y - line_y matters.
+        self._horizontal_y: Optional[float] = None
+        if (
+            self._full_span
+            and config.line[0][1] == config.line[1][1]
+            and config.line[1][0] > config.line[0][0]
+        ):
+            self._horizontal_y = float(config.line[0][1])
+
+        # Constraint scalars resolved once; squared threshold so the hot path
+        # compares displacements without taking a square root (sqrt only runs
+        # when an event is emitted).
+        self._min_age_frames = config.min_age_frames
+        self._min_displacement_px = config.min_displacement_px
+        self._min_displacement_sq = config.min_displacement_px ** 2
+
+        # Labels are fixed at construction; resolve the per-code lookup once
+        # instead of lowercasing the code and probing the dict per event
+        self._label_for = {
+            "A_TO_B": self.direction_labels.get("a_to_b", "A_TO_B"),
+            "B_TO_A": self.direction_labels.get("b_to_a", "B_TO_A"),
+        }
+
         # Platform metadata (set via set_metadata())
         self._detection_backend = "unknown"
         self._platform = None
@@ -155,68 +242,126 @@ class LineCounter(Counter):
             List of CountEvent for tracks that crossed the line.
         """
         events: List[CountEvent] = []
-        
+
         # Validate line exists
         if not self.line or len(self.line) != 2:
             return events
 
+        if not tracks:
+            return events
+
+        # Periodic sweep of state for tracks that left the scene keeps the
+        # dict bounded by concurrent tracks (~dozens) across long runs
+        if frame_idx - self._last_cleanup_frame >= _STATE_CLEANUP_INTERVAL_FRAMES:
+            self._last_cleanup_frame = frame_idx
+            if self._track_states:
+                live = {t.vehicle_id for t in tracks}
+                self._track_states = {
+                    k: v for k, v in self._track_states.items() if k in live
+                }
+
+        # Gather candidate tracks (uncounted, with enough trajectory) and
+        # their last two positions into (N, 2) arrays so the crossing test
+        # runs as one vectorized pass instead of per-track Python geometry.
+        candidates = []
+        endpoints = []
+        states = self._track_states
+        line_bbox = self._line_bbox
+        # Direct set membership: skips a bound-method call per track per frame
+        counted = self._counted_track_ids
         for track in tracks:
-            track_id = track.vehicle_id
-            trajectory = list(track.trajectory)
-            
-            # Skip if already counted
-            if self.is_counted(track_id):
+            # No copy: only the endpoints are needed, and deque tail access is O(1)
+            trajectory = track.trajectory
+            if track.vehicle_id in counted or len(trajectory) < 2:
                 continue
-            
-            # Need at least 2 trajectory points
-            if len(trajectory) < 2:
-                continue
-            
-            # Get or create track state
-            if track_id not in self._track_states:
-                self._track_states[track_id] = _LineTrackState(
+            # State is created as soon as a track qualifies (even far from the
+            # line) so first_frame/first_pos keep their original meaning for
+            # the age and displacement constraints.
+            st = states.get(track.vehicle_id)
+            if st is None:
+                st = states[track.vehicle_id] = _LineTrackState(
                     first_frame=frame_idx,
                     first_pos=trajectory[0],
                 )
-            st = self._track_states[track_id]
-            
-            # Get last two positions
-            prev = trajectory[-2]
+            # Cheap rejects before any geometry: tracks too young to count,
+            # then an L1 lower bound on displacement (|dx|+|dy| >= hypot, so
+            # a below-threshold L1 means the precise check would fail too)
+            if frame_idx - st.first_frame + 1 < self._min_age_frames:
+                continue
             curr = trajectory[-1]
-            
-            # Check for line crossing (returns "positive" or "negative")
-            internal_direction = crossed_line(prev, curr, self.line)
-            if internal_direction is None:
+            if (
+                abs(curr[0] - st.first_pos[0]) + abs(curr[1] - st.first_pos[1])
+                < self._min_displacement_px
+            ):
                 continue
-            
-            # Validate constraints
-            age_frames = frame_idx - st.first_frame + 1
-            displacement = _distance(st.first_pos, curr)
-            
-            if age_frames < self._line_config.min_age_frames:
+            # Skip tracks too far from the line to cross it this frame
+            if line_bbox is not None and (
+                curr[0] < line_bbox[0]
+                or curr[1] < line_bbox[1]
+                or curr[0] > line_bbox[2]
+                or curr[1] > line_bbox[3]
+            ):
                 continue
-            if displacement < self._line_config.min_displacement_px:
+            candidates.append(track)
+            endpoints.append(trajectory[-2])
+            endpoints.append(curr)
+
+        if not candidates:
+            return events
+
+        points = np.asarray(endpoints, dtype=np.float64).reshape(-1, 2, 2)
+        if self._horizontal_y is not None:
+            # Specialized path for the default ratio-generated line: signs
+            # come straight from the Y offsets, no cross products at all
+            p = points[:, 0, 1] - self._horizontal_y
+            c = points[:, 1, 1] - self._horizontal_y
+            dirs = np.where(p * c < 0, np.where(p < 0, 1, -1), 0).astype(np.int8)
+        else:
+            dirs = _batch_crossed_line_dir(
+                points[:, 0, :], points[:, 1, :], self._line_np, self._full_span
+            )
+
+        # One clock read per frame; every event this frame shares it
+        now = time.time()
+
+        # Only the (rare) tracks whose step crossed the line need Python work
+        for i in np.nonzero(dirs)[0]:
+            track = candidates[i]
+            track_id = track.vehicle_id
+            st = states[track_id]
+            curr = track.trajectory[-1]
+
+            # Precise displacement check (age and the L1 lower bound already
+            # passed in the gather loop; squared compare defers the sqrt
+            # until an event is actually emitted)
+            age_frames = frame_idx - st.first_frame + 1
+            dx = curr[0] - st.first_pos[0]
+            dy = curr[1] - st.first_pos[1]
+            displacement_sq = dx * dx + dy * dy
+            if displacement_sq < self._min_displacement_sq:
                 continue
+
+            displacement = math.sqrt(displacement_sq)
+
+            # Standard direction code (A_TO_B/B_TO_A) straight from the sign
+            direction_code = _DIR_FROM_SIGN[int(dirs[i]) > 0]
+
+            # Direction label resolved once at construction
+            direction_label = self._label_for[direction_code]
             
-            # Map internal direction to standard direction code (A_TO_B/B_TO_A)
-            direction_code = _DIRECTION_CODE_MAP[internal_direction]
-            
-            # Get direction label from config
-            # Use lowercase key format for config lookup (a_to_b, b_to_a)
-            label_key = direction_code.lower()
-            direction_label = self.direction_labels.get(label_key, direction_code)
-            
-            # Extract detection metadata from track
-            class_id = getattr(track, 'class_id', None)
-            class_name = getattr(track, 'class_name', None)
-            confidence = getattr(track, 'confidence', 1.0)
+            # Detection metadata: every track type (TrackedVehicle, Track)
+            # declares these fields with defaults, so plain attribute access
+            # replaces the getattr-with-default triple
+            class_id = track.class_id
+            class_name = track.class_name
+            confidence = track.confidence
             
             # Create count event with standard direction code
             event = CountEvent(
                 track_id=track_id,
                 direction=direction_code,  # Always A_TO_B or B_TO_A
                 direction_label=direction_label,
-                timestamp=time.time(),
+                timestamp=now,
                 counting_mode="line",
                 gate_sequence=None,
                 line_a_cross_frame=frame_idx,
@@ -226,15 +371,17 @@ class LineCounter(Counter):
                 class_id=class_id,
                 class_name=class_name,
                 confidence=confidence,
-                detection_backend=getattr(self, '_detection_backend', 'unknown'),
-                platform=getattr(self, '_platform', None),
-                process_pid=getattr(self, '_process_pid', None),
+                detection_backend=self._detection_backend,
+                platform=self._platform,
+                process_pid=self._process_pid,
             )
             events.append(event)
             
-            # Mark as counted in counter's internal state
+            # Mark as counted in counter's internal state; its crossing state
+            # is no longer needed (counted tracks are filtered up front)
             self.mark_counted(track_id)
-            
+            states.pop(track_id, None)
+
             # Sync counted flag to track object so tracker can handle it properly
             # This prevents track ID fragmentation from causing double-counts
             if hasattr(track, 'has_been_counted'):
@@ -278,11 +425,11 @@ def create_line_counter_from_config(
         frame_width: Frame width for ratio-to-pixel conversion.
         frame_height: Frame height for ratio-to-pixel conversion.
     """
-    from algorithms.counting.utils import compute_counting_line
+    from algorithms.counting.utils import compute_counting_line_cached
     
     # Use line_a as the single line for line mode
     line_cfg = counting_cfg.get("line") or counting_cfg.get("line_a")
-    line = compute_counting_line(line_cfg, frame_width, frame_height) if line_cfg else []
+    line = compute_counting_line_cached(line_cfg, frame_width, frame_height) if line_cfg else []
     
     # Direction labels use standard A_TO_B/B_TO_A keys
     direction_labels = counting_cfg.get("direction_labels", {}) or {
@@ -295,6 +442,7 @@ def create_line_counter_from_config(
         line=line,
         min_age_frames=int(counting_cfg.get("min_age_frames", 3)),
         min_displacement_px=float(counting_cfg.get("min_displacement_px", 15.0)),
+        frame_width=frame_width,
     )
     
     return LineCounter(config)
@@ -6,8 +6,11 @@ Shared helpers for line/gate counting algorithms.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import List, Tuple, Union
 
+import numpy as np
+
 
 CountingLineConfig = Union[float, int, List[List[float]]]
 
@@ -38,3 +41,61 @@ def compute_counting_line(
     p2 = (int(counting_config[1][0] * frame_width), int(counting_config[1][1] * frame_height))
     return [p1, p2]
 
+
+def compute_counting_lines_batch(
+    counting_configs: List[List[List[float]]],
+    frame_width: int,
+    frame_height: int,
+) -> np.ndarray:
+    """
+    Convert many ratio-based line definitions to pixel coordinates at once.
+
+    Vectorized companion to compute_counting_line for configs with several
+    lanes/zones: one broadcasted multiply replaces per-line tuple math.
+
+    Args:
+        counting_configs: N line definitions as [[x1,y1],[x2,y2]] ratios.
+        frame_width: Width of the frame in pixels.
+        frame_height: Height of the frame in pixels.
+
+    Returns:
+        (N, 2, 2) int32 array of line endpoints in pixels.
+    """
+    scale = np.array([frame_width, frame_height], dtype=np.float64)
+    return (np.asarray(counting_configs, dtype=np.float64) * scale).astype(np.int32)
+
+
+@lru_cache(maxsize=32)
+def _compute_counting_line_memo(
+    frozen_config,
+    frame_width: int,
+    frame_height: int,
+) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """Memoized core for compute_counting_line_cached (hashable config only)."""
+    if isinstance(frozen_config, tuple):
+        config: CountingLineConfig = [list(frozen_config[0]), list(frozen_config[1])]
+    else:
+        config = frozen_config
+    p1, p2 = compute_counting_line(config, frame_width, frame_height)
+    return (p1, p2)
+
+
+def compute_counting_line_cached(
+    counting_config: CountingLineConfig,
+    frame_width: int,
+    frame_height: int
+) -> List[Tuple[int, int]]:
+    """
+    Memoized variant of compute_counting_line.
+
+    Counter factories can be re-run on config reload or resolution change
+    with identical inputs; this caches per (config, width, height) so the
+    repeat calls skip the ratio math. Returns a fresh list each call so
+    callers may mutate it safely.
+    """
+    if isinstance(counting_config, (int, float)):
+        frozen = counting_config
+    else:
+        frozen = (tuple(counting_config[0]), tuple(counting_config[1]))
+    return list(_compute_counting_line_memo(frozen, frame_width, frame_height))
+
@@ -0,0 +1,10 @@
+"""
+Traffic Monitoring System - Cloud Module
+
+This module handles cloud integration with Google Cloud Platform.
+
+Kept free of eager submodule imports on purpose: pulling in sync/auth
+here would drag the whole google-cloud import chain into every
+``import cloud``, even for deployments that never sync. Import from the
+submodules directly (e.g. ``from cloud.sync import CloudSync``).
+"""
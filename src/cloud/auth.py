@@ -5,20 +5,52 @@ This module provides functions to authenticate with Google Cloud Platform
 using service account credentials stored in a JSON file.
 """
 
+from __future__ import annotations
+
 import os
 import logging
-from typing import Optional
-from google.oauth2 import service_account
-from google.auth import credentials as auth_credentials
+import stat
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from google.auth import credentials as auth_credentials
+
 
+@lru_cache(maxsize=8)
+def _load_cached(
+    path: str, mtime: float, scopes: Optional[Tuple[str, ...]]
+) -> "auth_credentials.Credentials":
+    """Load service account credentials, cached per (path, mtime, scopes).
 
-def get_credentials(credentials_path: str) -> Optional[auth_credentials.Credentials]:
+    from_service_account_file re-reads the JSON and re-parses the RSA
+    private key on every call (tens of ms of cryptography work); keying
+    the cache on mtime means a rotated key file still takes effect while
+    repeat loads of the same file are free.
+    """
+    # Deferred: google.oauth2 transitively imports cryptography/requests
+    # (~150-300 ms), which would otherwise tax every process start even
+    # when cloud sync is disabled.
+    from google.oauth2 import service_account
+
+    return service_account.Credentials.from_service_account_file(
+        path, scopes=list(scopes) if scopes else None
+    )
+
+
+def get_credentials(
+    credentials_path: str,
+    scopes: Optional[List[str]] = None,
+) -> Optional["auth_credentials.Credentials"]:
     """
     Load GCP service account credentials from a JSON file.
-    
+
     Args:
         credentials_path: Path to the service account JSON credentials file
-        
+        scopes: Optional OAuth scopes to restrict the credentials to.
+            Narrower scopes mean a smaller token exchange; None keeps the
+            default (full cloud-platform) scope.
+
     Returns:
         Service account credentials object, or None if loading failed
         
@@ -31,21 +63,29 @@ def get_credentials(credentials_path: str) -> Optional[auth_credentials.Credenti
         logging.error("Credentials path is empty")
         return None
     
-    if not os.path.exists(credentials_path):
-        logging.error(f"Credentials file not found: {credentials_path}")
+    # One stat covers existence, file-type check, and the cache key's
+    # mtime (exists + isfile + getmtime would be three syscalls).
+    # OSError also covers EACCES / ENOTDIR, which must yield None per the
+    # "returns None if loading failed" contract rather than propagate.
+    try:
+        st = os.stat(credentials_path)
+    except OSError as e:
+        logging.error(f"Credentials file not accessible: {credentials_path}: {e}")
         return None
-    
-    if not os.path.isfile(credentials_path):
+
+    if not stat.S_ISREG(st.st_mode):
         logging.error(f"Credentials path is not a file: {credentials_path}")
         return None
-    
+
     try:
-        credentials_obj = service_account.Credentials.from_service_account_file(
-            credentials_path
+        credentials_obj = _load_cached(
+            credentials_path,
+            st.st_mtime,
+            tuple(scopes) if scopes else None,
         )
         logging.info(f"Successfully loaded credentials from {credentials_path}")
         return credentials_obj
-        
+
     except Exception as e:
         logging.error(f"Failed to load credentials from {credentials_path}: {e}")
         return None
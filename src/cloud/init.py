@@ -1,11 +0,0 @@
-"""
-Traffic Monitoring System - Cloud Module
-
-This module handles cloud integration with Google Cloud Platform.
-"""
-
-from .sync import CloudSync
-from .auth import get_credentials
-from .utils import check_cloud_config, format_cloud_path
-
-__all__ = ['CloudSync', 'get_credentials', 'check_cloud_config', 'format_cloud_path']
\ No newline at end of file
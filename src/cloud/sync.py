@@ -6,10 +6,89 @@ import os
 import time
 import logging
 import json
+from concurrent import futures as cf
 from datetime import datetime
 import sqlite3
 import threading
 
+import numpy as np
+
+# Shortest worker poll interval; backs off exponentially up to the
+# configured sync interval while there is nothing to upload.
+_MIN_POLL_SECONDS = 5.0
+
+# Accepted direction values (legacy plus gate-based raw directions);
+# frozenset for O(1) membership when validating large batches.
+_VALID_DIRECTIONS = frozenset({
+    'northbound', 'southbound', 'unknown',  # legacy
+    'A_TO_B', 'B_TO_A',  # gate-based raw directions
+})
+
+# Process-wide GCP client cache keyed by (project_id, credentials_file).
+# Each Client owns an HTTP connection pool with warmed TLS state; building
+# fresh ones per CloudSync instance duplicates pools and re-handshakes.
+_CLIENT_CACHE = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# BigQuery table schemas, built once on first use. Lazy (rather than
+# module-level constants) so importing this module never pulls in the
+# google packages when cloud sync is disabled.
+_BQ_SCHEMAS = None
+
+
+def _bigquery_schemas():
+    """Return {'vehicles': ..., 'hourly': ..., 'daily': ...} SchemaField tuples."""
+    global _BQ_SCHEMAS
+    if _BQ_SCHEMAS is None:
+        from google.cloud import bigquery
+
+        _BQ_SCHEMAS = {
+            'vehicles': (
+                bigquery.SchemaField("id", "INTEGER", mode="REQUIRED"),
+                bigquery.SchemaField("timestamp", "FLOAT", mode="REQUIRED"),
+                bigquery.SchemaField("date_time", "STRING", mode="REQUIRED"),
+                bigquery.SchemaField("direction", "STRING", mode="NULLABLE"),
+                bigquery.SchemaField("direction_label", "STRING", mode="NULLABLE"),
+                bigquery.SchemaField("recorded_at", "TIMESTAMP", mode="NULLABLE"),
+                # Schema v3: Object classification and quality
+                bigquery.SchemaField("class_id", "INTEGER", mode="NULLABLE"),
+                bigquery.SchemaField("class_name", "STRING", mode="NULLABLE"),
+                bigquery.SchemaField("confidence", "FLOAT", mode="NULLABLE"),
+                # Schema v3: Platform metadata
+                bigquery.SchemaField("detection_backend", "STRING", mode="NULLABLE"),
+                bigquery.SchemaField("platform", "STRING", mode="NULLABLE"),
+                bigquery.SchemaField("process_pid", "INTEGER", mode="NULLABLE"),
+            ),
+            'hourly': (
+                bigquery.SchemaField("id", "INTEGER", mode="REQUIRED"),
+                bigquery.SchemaField("hour_beginning", "TIMESTAMP", mode="REQUIRED"),
+                bigquery.SchemaField("vehicle_count", "INTEGER", mode="REQUIRED"),
+            ),
+            'daily': (
+                bigquery.SchemaField("id", "INTEGER", mode="REQUIRED"),
+                bigquery.SchemaField("date", "STRING", mode="REQUIRED"),
+                bigquery.SchemaField("vehicle_count", "INTEGER", mode="REQUIRED"),
+            ),
+        }
+    return _BQ_SCHEMAS
+
+
+def _get_clients(project_id, credentials, credentials_file):
+    """Return shared (storage_client, bigquery_client) for this identity."""
+    key = (project_id, credentials_file)
+    with _CLIENT_CACHE_LOCK:
+        clients = _CLIENT_CACHE.get(key)
+        if clients is None:
+            from google.cloud import storage, bigquery
+
+            clients = (
+                storage.Client(project=project_id, credentials=credentials),
+                bigquery.Client(project=project_id, credentials=credentials),
+            )
+            _CLIENT_CACHE[key] = clients
+    return clients
+
+
 class CloudSync:
     """Synchronizes local data with cloud services."""
     
@@ -30,42 +109,67 @@ class CloudSync:
         self.max_retry_attempts = config['gcp']['sync']['max_retry_attempts']
         self.retry_delay = config['gcp']['sync']['retry_delay_seconds']
         self.batch_size = config['gcp']['sync']['batch_size']
+        # Rows per insert_rows_json request. Streaming inserts are capped at
+        # 50k rows / 10 MB per request; small chunks also keep per-request
+        # latency flat, so one sync pass can drain any backlog safely.
+        self.bq_chunk_size = config['gcp']['sync'].get('bq_chunk_size', 500)
         
         # Tracking variables
         self.last_sync_time = 0
         self.last_synced_id = 0
         self._sync_thread = None
-        self._stop_sync = False
+        self._stop_event = threading.Event()
+        # Writers may set() this after a burst of inserts to trigger an
+        # immediate sync instead of waiting out the interval
+        self.wake_event = threading.Event()
+        self._last_sync_rows = 0
+
+        # Shared SQLite connection for the sync path, opened lazily and
+        # reused across passes: connection setup plus the default
+        # rollback-journal settings dominate these short transactions.
+        self._db = None
+        self._db_lock = threading.Lock()
+
+        # Pool for overlapping I/O-bound cloud calls: BigQuery chunk
+        # inserts go out in parallel and video uploads no longer block
+        # the caller (the pipeline thread) on a GCS round trip.
+        self._executor = None
         
         # Try to initialize cloud clients
         try:
-            # Import GCP libraries only if needed
-            from google.cloud import storage, bigquery
             from .auth import get_credentials
-            
+
             # Get credentials
             self.credentials = get_credentials(config['gcp']['credentials_file'])
             if self.credentials is None:
                 logging.warning("Cloud sync disabled due to missing credentials")
                 return
-            
+
             self.project_id = config['gcp']['project_id']
-            
-            # Initialize GCP clients
-            self.storage_client = storage.Client(
-                project=self.project_id, 
-                credentials=self.credentials
-            )
-            self.bigquery_client = bigquery.Client(
-                project=self.project_id, 
-                credentials=self.credentials
+
+            # Shared GCP clients (one connection pool per identity per process)
+            self.storage_client, self.bigquery_client = _get_clients(
+                self.project_id, self.credentials, config['gcp']['credentials_file']
             )
             
             # Get cloud storage bucket
             self.bucket = self.storage_client.bucket(
                 config['gcp']['storage']['bucket_name']
             )
-            
+
+            self._executor = cf.ThreadPoolExecutor(
+                max_workers=config['gcp']['sync'].get('workers', 4),
+                thread_name_prefix='cloud-sync',
+            )
+
+            # Fully-qualified streaming-insert target, formatted once
+            # instead of per batch
+            self._vehicles_table_ref = (
+                f"{self.project_id}"
+                f".{config['gcp']['bigquery']['dataset_id']}"
+                f".{config['gcp']['bigquery']['vehicles_table']}"
+            )
+
             self.is_cloud_enabled = True
             logging.info("Cloud sync module initialized successfully")
             
@@ -83,7 +187,7 @@ class CloudSync:
             return False
             
         if self._sync_thread is None or not self._sync_thread.is_alive():
-            self._stop_sync = False
+            self._stop_event.clear()
             self._sync_thread = threading.Thread(target=self._sync_worker)
             self._sync_thread.daemon = True
             self._sync_thread.start()
@@ -93,10 +197,34 @@ class CloudSync:
     
     def stop_sync_thread(self):
         """Stop the background sync thread."""
-        self._stop_sync = True
+        self._stop_event.set()
+        self.wake_event.set()  # unblock the worker's wait immediately
         if self._sync_thread and self._sync_thread.is_alive():
             self._sync_thread.join(timeout=10)
             logging.info("Cloud sync thread stopped")
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_db(self):
+        """Open (once) and return the shared sync connection.
+
+        WAL mode lets the pipeline's writer proceed while sync reads, and
+        synchronous=NORMAL drops the per-commit fsync that the default
+        FULL setting pays on every mark-synced transaction.
+        """
+        if self._db is None:
+            self._db = sqlite3.connect(self.database_path, check_same_thread=False)
+            self._db.row_factory = sqlite3.Row
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("PRAGMA temp_store=MEMORY")
+            self._db.execute("PRAGMA cache_size=-65536")
+        return self._db
     
     def _update_table_schema(self, table_ref, expected_schema, table_name):
         """
@@ -166,36 +294,12 @@ class CloudSync:
                 dataset = self.bigquery_client.create_dataset(dataset, exists_ok=True)
                 logging.info(f"Created BigQuery dataset '{dataset_id}'")
             
-            # Define table schemas
-            vehicle_detections_schema = [
-                bigquery.SchemaField("id", "INTEGER", mode="REQUIRED"),
-                bigquery.SchemaField("timestamp", "FLOAT", mode="REQUIRED"),
-                bigquery.SchemaField("date_time", "STRING", mode="REQUIRED"),
-                bigquery.SchemaField("direction", "STRING", mode="NULLABLE"),
-                bigquery.SchemaField("direction_label", "STRING", mode="NULLABLE"),
-                bigquery.SchemaField("recorded_at", "TIMESTAMP", mode="NULLABLE"),
-                # Schema v3: Object classification and quality
-                bigquery.SchemaField("class_id", "INTEGER", mode="NULLABLE"),
-                bigquery.SchemaField("class_name", "STRING", mode="NULLABLE"),
-                bigquery.SchemaField("confidence", "FLOAT", mode="NULLABLE"),
-                # Schema v3: Platform metadata
-                bigquery.SchemaField("detection_backend", "STRING", mode="NULLABLE"),
-                bigquery.SchemaField("platform", "STRING", mode="NULLABLE"),
-                bigquery.SchemaField("process_pid", "INTEGER", mode="NULLABLE"),
-            ]
-            
-            hourly_counts_schema = [
-                bigquery.SchemaField("id", "INTEGER", mode="REQUIRED"),
-                bigquery.SchemaField("hour_beginning", "TIMESTAMP", mode="REQUIRED"),
-                bigquery.SchemaField("vehicle_count", "INTEGER", mode="REQUIRED"),
-            ]
-            
-            daily_counts_schema = [
-                bigquery.SchemaField("id", "INTEGER", mode="REQUIRED"),
-                bigquery.SchemaField("date", "STRING", mode="REQUIRED"),
-                bigquery.SchemaField("vehicle_count", "INTEGER", mode="REQUIRED"),
-            ]
-            
+            # Table schemas (built once per process, see _bigquery_schemas)
+            schemas = _bigquery_schemas()
+            vehicle_detections_schema = schemas['vehicles']
+            hourly_counts_schema = schemas['hourly']
+            daily_counts_schema = schemas['daily']
+
             # Ensure vehicle_detections table exists
             vehicles_table_id = self.config['gcp']['bigquery']['vehicles_table']
             vehicles_table_ref = dataset_ref.table(vehicles_table_id)
@@ -244,19 +348,34 @@ class CloudSync:
             logging.warning("Continuing with cloud sync, but tables may not exist")
     
     def _sync_worker(self):
-        """Background worker for periodic syncing."""
-        while not self._stop_sync:
+        """Background worker for periodic syncing.
+
+        Waits on an Event instead of a fixed 60 s sleep: wake_event cuts
+        the wait short when a writer requests an immediate sync, stop
+        returns promptly, and idle cycles back off exponentially up to the
+        sync interval instead of waking every minute for nothing.
+        """
+        poll = _MIN_POLL_SECONDS
+        while not self._stop_event.is_set():
             try:
-                # Check if it's time to sync
                 current_time = time.time()
-                if current_time - self.last_sync_time >= self.sync_interval:
+                if (self.wake_event.is_set()
+                        or current_time - self.last_sync_time >= self.sync_interval):
+                    self.wake_event.clear()
                     self.sync_data()
-                    self.last_sync_time = current_time
+                    self.last_sync_time = time.time()
+                    if self._last_sync_rows:
+                        poll = _MIN_POLL_SECONDS
+                    else:
+                        poll = min(poll * 2, self.sync_interval)
             except Exception as e:
                 logging.error(f"Error in sync worker: {e}")
-            
-            # Sleep before next check
-            time.sleep(60)  # Check every minute
+                # Back off on failures too: a dead network or DB would
+                # otherwise retry a full (failing) sync pass every
+                # _MIN_POLL_SECONDS
+                poll = min(poll * 2, self.sync_interval)
+
+            self.wake_event.wait(timeout=poll)
     
     def sync_data(self):
         """
@@ -298,12 +417,16 @@ class CloudSync:
     
     def _sync_vehicle_detections(self):
         """Sync count events (vehicle detections) to BigQuery."""
+        with self._db_lock:
+            self._sync_vehicle_detections_locked()
+
+    def _sync_vehicle_detections_locked(self):
+        """Body of _sync_vehicle_detections; caller holds _db_lock."""
         try:
-            # Connect to local database
-            conn = sqlite3.connect(self.database_path)
-            conn.row_factory = sqlite3.Row
+            # Reuse the shared connection (opened once, WAL mode)
+            conn = self._get_db()
             cursor = conn.cursor()
-            
+
             # Check if count_events table exists (new schema)
             cursor.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name='count_events'"
@@ -312,101 +435,205 @@ class CloudSync:
                 logging.info("No count_events table found - skipping sync")
                 return
             
-            # Get unsynchronized records from new count_events table
-            cursor.execute(
-                '''
-                SELECT * FROM count_events 
-                WHERE cloud_synced = 0
-                ORDER BY id 
-                LIMIT ?
-                ''',
-                (self.batch_size,)
-            )
-            
-            records = cursor.fetchall()
-            if not records:
+            # Drain the whole unsynced backlog in this pass: each iteration
+            # selects one SQLite batch, streams it to BigQuery, and marks
+            # it synced, which removes it from the next
+            # WHERE cloud_synced = 0 fetch. Previously one batch per sync
+            # tick meant a large backlog took hours to clear. A separate
+            # cursor does the UPDATEs so the batch SELECT is never walked
+            # and written by the same cursor.
+            total_synced = 0
+            update_cursor = conn.cursor()
+            while True:
+                cursor.execute(
+                    '''
+                    SELECT * FROM count_events
+                    WHERE cloud_synced = 0
+                    ORDER BY id
+                    LIMIT ?
+                    ''',
+                    (self.batch_size,)
+                )
+
+                synced, fetched = self._sync_detection_batch(
+                    cursor, update_cursor, conn
+                )
+                total_synced += synced
+
+                if fetched < self.batch_size:
+                    break
+
+            self._last_sync_rows = total_synced
+            if total_synced:
+                logging.info(f"Successfully synced {total_synced} count events")
+            else:
                 logging.info("No new count events to sync")
-                return
-            
-            logging.info(f"Syncing {len(records)} count event records")
-            
-            # Prepare data for BigQuery (map count_events to vehicle_detections schema)
-            rows_to_insert = []
-            record_ids = []
-            
-            for record in records:
-                row = dict(record)
-                record_ids.append(row['id'])
-                
-                # Map count_events fields to BigQuery vehicle_detections schema
-                ts_seconds = row['ts'] / 1000.0 if row.get('ts') else time.time()
-                bq_row = {
-                    'id': row['id'],
-                    'timestamp': ts_seconds,
-                    'date_time': datetime.fromtimestamp(ts_seconds).isoformat(),
-                    'direction': row.get('direction_code', 'unknown'),
-                    'direction_label': row.get('direction_label'),
-                    'recorded_at': datetime.utcnow().isoformat(),
-                    # Schema v3: Object classification and quality
-                    'class_id': row.get('class_id'),
-                    'class_name': row.get('class_name'),
-                    'confidence': row.get('confidence'),
-                    # Schema v3: Platform metadata
-                    'detection_backend': row.get('detection_backend'),
-                    'platform': row.get('platform'),
-                    'process_pid': row.get('process_pid'),
-                }
-                
-                # Remove None values to avoid BigQuery errors
-                bq_row = {k: v for k, v in bq_row.items() if v is not None}
-                
-                # Validate data before adding
-                if self._validate_vehicle_detection(bq_row):
-                    rows_to_insert.append(bq_row)
-                else:
-                    logging.warning(f"Skipping invalid count event record {row.get('id')}")
-                    continue
-            
-            if not rows_to_insert:
-                logging.info("No valid count events to sync after validation")
-                # Mark records as synced even if invalid to avoid retrying
-                if record_ids:
-                    placeholders = ','.join(['?' for _ in record_ids])
-                    cursor.execute(
-                        f"UPDATE count_events SET cloud_synced = 1 WHERE id IN ({placeholders})",
-                        record_ids
-                    )
-                    conn.commit()
-                return
-            
-            # Get BigQuery table reference
-            dataset_id = self.config['gcp']['bigquery']['dataset_id']
-            table_id = self.config['gcp']['bigquery']['vehicles_table']
-            table_ref = f"{self.project_id}.{dataset_id}.{table_id}"
-            
-            # Insert data to BigQuery
-            errors = self.bigquery_client.insert_rows_json(table_ref, rows_to_insert)
-            if errors:
-                logging.error(f"BigQuery insertion errors: {errors}")
-                raise Exception("Failed to insert data into BigQuery")
-            
-            # Mark records as synced in count_events table
-            placeholders = ','.join(['?' for _ in record_ids])
-            cursor.execute(
-                f"UPDATE count_events SET cloud_synced = 1 WHERE id IN ({placeholders})",
-                record_ids
-            )
-            conn.commit()
-            
-            logging.info(f"Successfully synced {len(records)} count events")
-        
+
         except Exception as e:
             logging.error(f"Error syncing count events: {e}")
             raise
-        finally:
-            if 'conn' in locals():
-                conn.close()
-    
+
+    @staticmethod
+    def _mark_synced(cursor, conn, record_ids):
+        """Flag rows as cloud_synced in one transaction.
+
+        executemany reuses a single prepared statement instead of building
+        a one-off IN (?,?,...) string that SQLite must re-parse and that
+        hits the 999-variable limit on large batches; one commit means one
+        fsync (a WAL append) for the whole batch.
+        """
+        cursor.executemany(
+            "UPDATE count_events SET cloud_synced = 1 WHERE id = ?",
+            [(rid,) for rid in record_ids],
+        )
+        conn.commit()
+
+    def _build_bq_rows(self, records, fallback_now, recorded_at):
+        """Map one chunk of count_events rows to the BigQuery schema.
+
+        Returns (rows_to_insert, row_ids, invalid_ids) where row_ids is
+        aligned with rows_to_insert and invalid_ids are rows that failed
+        validation (marked synced without upload so they aren't retried).
+        """
+        rows_to_insert = []
+        row_ids = []
+        invalid_ids = []
+
+        # Vectorize the timestamp formatting: per-row
+        # datetime.fromtimestamp().isoformat() was the hottest pure-Python
+        # work in the batch path. datetime64 renders in UTC; recorded_at is
+        # batch-level ("when this upload happened") so the caller passes
+        # one value for all rows.
+        dict_rows = [dict(record) for record in records]
+        ts_seconds = np.array(
+            [row['ts'] / 1000.0 if row.get('ts') else fallback_now for row in dict_rows],
+            dtype=np.float64,
+        )
+        date_times = np.datetime_as_string(ts_seconds.astype('datetime64[s]'), unit='s')
+
+        for row, ts_sec, date_time in zip(dict_rows, ts_seconds, date_times):
+            # Validate while building, in one pass. The required fields
+            # and date_time format are guaranteed by construction below,
+            # so only the checks on stored values remain: a positive
+            # timestamp and a known (or absent) direction.
+            timestamp = float(ts_sec)
+            direction = row.get('direction_code', 'unknown')
+            if timestamp <= 0:
+                logging.warning(f"Invalid timestamp: {timestamp}")
+                logging.warning(f"Skipping invalid count event record {row.get('id')}")
+                invalid_ids.append(row['id'])
+                continue
+            if direction is not None and direction not in _VALID_DIRECTIONS:
+                logging.warning(f"Invalid direction: {direction}")
+                logging.warning(f"Skipping invalid count event record {row.get('id')}")
+                invalid_ids.append(row['id'])
+                continue
+
+            # Map count_events fields to BigQuery vehicle_detections schema
+            bq_row = {
+                'id': row['id'],
+                'timestamp': timestamp,
+                'date_time': str(date_time),
+                'direction': direction,
+                'direction_label': row.get('direction_label'),
+                'recorded_at': recorded_at,
+                # Schema v3: Object classification and quality
+                'class_id': row.get('class_id'),
+                'class_name': row.get('class_name'),
+                'confidence': row.get('confidence'),
+                # Schema v3: Platform metadata
+                'detection_backend': row.get('detection_backend'),
+                'platform': row.get('platform'),
+                'process_pid': row.get('process_pid'),
+            }
+
+            # Remove None values to avoid BigQuery errors
+            bq_row = {k: v for k, v in bq_row.items() if v is not None}
+
+            rows_to_insert.append(bq_row)
+            row_ids.append(row['id'])
+
+        return rows_to_insert, row_ids, invalid_ids
+
+    def _sync_detection_batch(self, cursor, update_cursor, conn):
+        """Stream one selected batch of count_events rows to BigQuery.
+
+        Pulls rows off `cursor` in insert-chunk-sized slices with
+        fetchmany() and submits each slice as soon as it is built, instead
+        of materializing the whole batch with fetchall() first: peak
+        memory tracks bq_chunk_size rather than batch_size, and the first
+        insert request is in flight while later rows are still being
+        fetched. Returns (rows_marked_synced, rows_fetched).
+        """
+        table_ref = self._vehicles_table_ref
+        fallback_now = time.time()
+        recorded_at = datetime.utcnow().isoformat()
+
+        # Chunks go out in parallel on the shared executor: the requests
+        # are independent and latency-bound, so a large backlog drains in
+        # roughly one round trip per pool-width chunks instead of one per
+        # chunk. Only the rows each request actually accepted get marked.
+        synced_ids = []
+        pending = {}
+        fetched = 0
+        while True:
+            records = cursor.fetchmany(self.bq_chunk_size)
+            if not records:
+                break
+            fetched += len(records)
+
+            chunk, chunk_ids, invalid_ids = self._build_bq_rows(
+                records, fallback_now, recorded_at
+            )
+            synced_ids.extend(invalid_ids)
+            if chunk:
+                # row_ids=[None, ...] omits insertId, opting out of
+                # BigQuery's best-effort dedup and its lower throughput
+                # quota; the cloud_synced flag already prevents re-uploads.
+                future = self._executor.submit(
+                    self.bigquery_client.insert_rows_json,
+                    table_ref,
+                    chunk,
+                    row_ids=[None] * len(chunk),
+                    skip_invalid_rows=False,
+                )
+                pending[future] = chunk_ids
+
+        if fetched:
+            logging.info(f"Syncing {fetched} count event records")
+
+        had_errors = False
+        for future in cf.as_completed(pending):
+            chunk_ids = pending[future]
+            try:
+                errors = future.result()
+            except Exception as e:
+                # Request-level failure: leave this chunk unmarked so the
+                # retry path in sync_data picks it up again
+                logging.error(f"BigQuery insert request failed: {e}")
+                had_errors = True
+                continue
+            if errors:
+                logging.error(f"BigQuery insertion errors: {errors}")
+                had_errors = True
+                failed_indices = {e.get('index') for e in errors}
+                synced_ids.extend(
+                    rid for j, rid in enumerate(chunk_ids) if j not in failed_indices
+                )
+            else:
+                synced_ids.extend(chunk_ids)
+
+        # Mark records as synced in count_events table
+        if synced_ids:
+            self._mark_synced(update_cursor, conn, synced_ids)
+
+        if had_errors:
+            # Failed rows stay unmarked and are retried by sync_data
+            raise Exception("Failed to insert data into BigQuery")
+
+        return len(synced_ids), fetched
+
+
     def _sync_hourly_counts(self):
         """
         Sync hourly counts to BigQuery.
@@ -433,19 +660,27 @@ class CloudSync:
     
     def upload_video_sample(self, video_path, metadata=None):
         """
-        Upload a video sample to Cloud Storage.
-        
+        Upload a video sample to Cloud Storage in the background.
+
+        The upload runs on the shared executor so the caller (the pipeline
+        thread, mid video-rotation) is not blocked for the duration of a
+        GCS round trip plus retries.
+
         Args:
             video_path: Path to the local video file
             metadata: Optional dictionary of metadata
-        
+
         Returns:
-            URL of the uploaded video or None if upload failed
+            Future resolving to the URL of the uploaded video (or None if
+            the upload failed), or None if cloud sync is not enabled
         """
         if not self.is_cloud_enabled:
             logging.warning("Cannot upload video: Cloud sync is not enabled")
             return None
-            
+        return self._executor.submit(self._do_upload_video_sample, video_path, metadata)
+
+    def _do_upload_video_sample(self, video_path, metadata=None):
+        """Blocking body of upload_video_sample; runs on the executor."""
         try:
             # Create a unique blob name
             filename = os.path.basename(video_path)
@@ -486,52 +721,6 @@ class CloudSync:
             
             return None
     
-    def _validate_vehicle_detection(self, row: dict) -> bool:
-        """
-        Validate a vehicle detection record before syncing to BigQuery.
-        
-        Args:
-            row: Dictionary containing vehicle detection data
-            
-        Returns:
-            True if valid, False otherwise
-        """
-        try:
-            # Check required fields
-            required_fields = ['id', 'timestamp', 'date_time']
-            for field in required_fields:
-                if field not in row:
-                    logging.warning(f"Missing required field '{field}' in vehicle detection")
-                    return False
-            
-            # Validate timestamp (should be a positive number)
-            timestamp = row.get('timestamp')
-            if not isinstance(timestamp, (int, float)) or timestamp <= 0:
-                logging.warning(f"Invalid timestamp: {timestamp}")
-                return False
-            
-            # Validate date_time format (basic check)
-            date_time = row.get('date_time')
-            if not isinstance(date_time, str) or len(date_time) < 10:
-                logging.warning(f"Invalid date_time format: {date_time}")
-                return False
-            
-            # Validate direction if present (accept legacy and gate-based values)
-            direction = row.get('direction')
-            valid_directions = [
-                'northbound', 'southbound', 'unknown',  # legacy
-                'A_TO_B', 'B_TO_A',  # gate-based raw directions
-            ]
-            if direction is not None and direction not in valid_directions:
-                logging.warning(f"Invalid direction: {direction}")
-                return False
-            
-            return True
-        
-        except Exception as e:
-            logging.error(f"Error validating vehicle detection: {e}")
-            return False
-    
     def _validate_hourly_count(self, row: dict) -> bool:
         """
         Validate an hourly count record before syncing to BigQuery.
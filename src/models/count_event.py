@@ -8,11 +8,15 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CountEvent:
     """
     A counting event emitted when a tracked object crosses the counting gate.
-    
+
+    Slotted: events are created in bursts when traffic clears a gate, and
+    dropping the per-instance __dict__ makes construction cheaper and the
+    instances roughly a third the size.
+
     Attributes:
         track_id: ID of the track that triggered the event.
         direction: Direction code (e.g., "A_TO_B", "B_TO_A").
@@ -55,6 +55,11 @@ class ObservationSource(ABC):
                 process(frame_data)
     """
 
+    # Slotted so concrete sources that also declare __slots__ stay free of
+    # a per-instance __dict__; subclasses without __slots__ (e.g. test
+    # doubles) still get one and can attach arbitrary attributes.
+    __slots__ = ("_config", "_is_open", "_frame_index")
+
     def __init__(self, config: ObservationConfig):
         self._config = config
         self._is_open = False
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 import time
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional, Tuple, Union
@@ -26,6 +27,76 @@ from .base import ObservationSource, ObservationConfig
 from .rtsp_utils import sanitize_url
 
 
+# Module-level aliases for the capture properties: one LOAD_GLOBAL dict
+# lookup instead of an attribute lookup on the cv2 module per use, and the
+# property set handled in one visible place.
+_CAP_PROP_FOURCC = cv2.CAP_PROP_FOURCC
+_CAP_PROP_FRAME_WIDTH = cv2.CAP_PROP_FRAME_WIDTH
+_CAP_PROP_FRAME_HEIGHT = cv2.CAP_PROP_FRAME_HEIGHT
+_CAP_PROP_FPS = cv2.CAP_PROP_FPS
+_CAP_PROP_BUFFERSIZE = cv2.CAP_PROP_BUFFERSIZE
+_CAP_PROP_FRAME_COUNT = cv2.CAP_PROP_FRAME_COUNT
+
+# Serializes writes to OPENCV_FFMPEG_CAPTURE_OPTIONS, which is process-wide
+# mutable state read by FFmpeg at VideoCapture construction. Without this,
+# two sources opening concurrently (multi-camera rigs) could open with each
+# other's transport options.
+_FFMPEG_ENV_LOCK = threading.Lock()
+
+
+def _open_ffmpeg_capture(device_id: Union[int, str], options: str) -> "cv2.VideoCapture":
+    """Open a capture on the FFmpeg backend with per-open capture options.
+
+    Sets OPENCV_FFMPEG_CAPTURE_OPTIONS only for the duration of the
+    constructor call and restores the previous value afterwards, so the
+    options never leak into unrelated opens elsewhere in the process.
+    """
+    with _FFMPEG_ENV_LOCK:
+        prev = os.environ.get("OPENCV_FFMPEG_CAPTURE_OPTIONS")
+        os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = options
+        try:
+            return cv2.VideoCapture(device_id, cv2.CAP_FFMPEG)
+        finally:
+            if prev is None:
+                os.environ.pop("OPENCV_FFMPEG_CAPTURE_OPTIONS", None)
+            else:
+                os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = prev
+
+
+def _plan_rotate_flip(
+    rotate: int,
+    flip_horizontal: bool,
+    flip_vertical: bool,
+) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Collapse rotate/flip settings into at most one rotate and one flip.
+
+    A 180-degree rotation permutes pixels exactly like flipping both axes,
+    so it is folded into the flip pass (two flips cancel). Returns the
+    cv2.ROTATE_* code (or None) and the cv2.flip code (or None).
+    """
+    if rotate == 180:
+        flip_horizontal = not flip_horizontal
+        flip_vertical = not flip_vertical
+        rotate = 0
+
+    rotate_code: Optional[int] = None
+    if rotate == 90:
+        rotate_code = cv2.ROTATE_90_CLOCKWISE
+    elif rotate == 270:
+        rotate_code = cv2.ROTATE_90_COUNTERCLOCKWISE
+
+    flip_code: Optional[int] = None
+    if flip_horizontal and flip_vertical:
+        flip_code = -1
+    elif flip_horizontal:
+        flip_code = 1
+    elif flip_vertical:
+        flip_code = 0
+
+    return rotate_code, flip_code
+
+
 @dataclass
 class OpenCVSourceConfig(ObservationConfig):
     """
@@ -36,6 +107,19 @@ class OpenCVSourceConfig(ObservationConfig):
         rtsp_transport: Transport protocol for RTSP ("tcp" or "udp").
         buffer_size: OpenCV capture buffer size (reduces latency for live feeds).
         max_retries: Maximum retries for camera initialization.
+        fourcc: Pixel format requested from USB cameras (4 chars). MJPG avoids
+            the YUYV bandwidth wall that caps 1080p USB streams at ~5 fps.
+        backend: Capture backend selection (config key "capture_backend",
+            distinct from camera.backend which picks the source class).
+            "auto" (default) picks
+            FFmpeg/V4L2 per device type; "gstreamer" wraps a USB device in
+            a GStreamer appsink pipeline with drop=true max-buffers=1 for
+            guaranteed single-frame buffering (Linux only, needs an OpenCV
+            build with GStreamer support).
+        capture_cpu: CPU core to pin the grabber thread to (Linux only).
+            None picks the last core. Keeps the per-frame decode/copy
+            working set warm in one core's cache instead of migrating
+            under the inference threads.
         swap_rb: Swap R/B channels (fixes RGB vs BGR issues).
         rotate: Rotation in degrees (0, 90, 180, 270).
         flip_horizontal: Flip frame horizontally.
@@ -45,6 +129,9 @@ class OpenCVSourceConfig(ObservationConfig):
     rtsp_transport: str = "tcp"
     buffer_size: int = 1
     max_retries: int = 3
+    fourcc: str = "MJPG"
+    backend: str = "auto"
+    capture_cpu: Optional[int] = None
     swap_rb: bool = False
     rotate: int = 0
     flip_horizontal: bool = False
@@ -71,6 +158,9 @@ class OpenCVSourceConfig(ObservationConfig):
             rtsp_transport=camera_cfg.get("rtsp_transport", "tcp"),
             buffer_size=camera_cfg.get("buffer_size", 1),
             max_retries=camera_cfg.get("max_retries", 3),
+            fourcc=camera_cfg.get("fourcc", "MJPG"),
+            backend=camera_cfg.get("capture_backend", "auto"),
+            capture_cpu=camera_cfg.get("capture_cpu"),
             swap_rb=camera_cfg.get("swap_rb", False),
             rotate=camera_cfg.get("rotate", 0) or 0,
             flip_horizontal=camera_cfg.get("flip_horizontal", False),
@@ -92,6 +182,29 @@ class OpenCVSource(ObservationSource):
                 process(frame_data.frame)
     """
 
+    __slots__ = (
+        "_opencv_config",
+        "_cap",
+        "_consecutive_failures",
+        "_start_time",
+        "_frame_lock",
+        "_new_frame",
+        "_latest",
+        "_stop_grabber",
+        "_grabber",
+        "_video_info",
+        "_is_rtsp",
+        "_is_usb",
+        "_is_file",
+        "_backend",
+        "_reinit_fail_threshold",
+        "_gst_pipeline",
+        "_rotate_code",
+        "_flip_code",
+        "_has_transforms",
+        "_log_times",
+    )
+
     def __init__(self, config: OpenCVSourceConfig):
         super().__init__(config)
         self._opencv_config = config
@@ -99,6 +212,82 @@ class OpenCVSource(ObservationSource):
         self._consecutive_failures = 0
         self._start_time: Optional[float] = None
 
+        # Classify the device once; device_id never changes after
+        # construction, and is_file previously hit the filesystem
+        # (os.path.exists) on every read-failure branch. Pinning the
+        # backend here also keeps the choice in one place: FFmpeg for
+        # RTSP (so the capture options apply), V4L2 for USB on Linux.
+        device_id = config.device_id
+        self._is_rtsp = isinstance(device_id, str) and device_id.lower().startswith(
+            ("rtsp://", "rtsps://")
+        )
+        self._is_usb = isinstance(device_id, int)
+        self._is_file = (
+            isinstance(device_id, str)
+            and not self._is_rtsp
+            and os.path.exists(device_id)
+        )
+        if self._is_rtsp:
+            self._backend = cv2.CAP_FFMPEG
+        elif self._is_usb and os.name == "posix":
+            self._backend = cv2.CAP_V4L2
+        else:
+            self._backend = cv2.CAP_ANY
+
+        # Failure policy differs by transport: an RTSP demuxer usually
+        # recovers from dropped packets on its own, and a reopen costs a
+        # full DESCRIBE/SETUP/PLAY round trip, so tolerate several misses
+        # before rebuilding the socket. A USB read failure almost always
+        # means the device vanished, so reinitialize immediately.
+        self._reinit_fail_threshold = 10 if self._is_rtsp else 1
+
+        # Optional GStreamer path for USB cameras on Linux: V4L2's frame
+        # queue depth is not reliably controllable, but appsink with
+        # drop=true max-buffers=1 sync=false enforces one-frame buffering
+        # at the element level.
+        self._gst_pipeline: Optional[str] = None
+        if config.backend == "gstreamer":
+            if self._is_usb and os.name == "posix" and config.resolution:
+                w, h = config.resolution
+                fps = int(config.fps or 30)
+                self._gst_pipeline = (
+                    f"v4l2src device=/dev/video{config.device_id} ! "
+                    f"videoconvert ! "
+                    f"video/x-raw,format=BGR,width={w},height={h},framerate={fps}/1 ! "
+                    f"appsink drop=true max-buffers=1 sync=false"
+                )
+            else:
+                logging.warning(
+                    "backend=gstreamer requires a USB device index, Linux, and an "
+                    "explicit resolution; falling back to the default backend"
+                )
+
+        # Latest-frame slot fed by a background grabber thread (live sources
+        # only). Decouples capture latency from processing latency: when
+        # downstream is slower than the camera, the grabber keeps draining
+        # the OpenCV/ffmpeg buffer so read() always sees the newest frame
+        # instead of one that sat in the queue for seconds.
+        self._frame_lock = threading.Lock()
+        self._new_frame = threading.Event()
+        self._latest: Optional[Tuple[bool, Optional[np.ndarray]]] = None
+        self._stop_grabber = threading.Event()
+        self._grabber: Optional[threading.Thread] = None
+        self._video_info: Dict[str, Any] = {}
+        self._log_times: Dict[str, float] = {}
+
+        # Transform plan resolved once: fold rotate-180 into the flip pass
+        # (same pixel permutation as flipping both axes) and precompute the
+        # flip code, so each frame pays at most one rotate, one flip, and
+        # one channel swap instead of re-deriving the plan per frame.
+        self._rotate_code, self._flip_code = _plan_rotate_flip(
+            config.rotate, config.flip_horizontal, config.flip_vertical
+        )
+        self._has_transforms = (
+            self._rotate_code is not None
+            or self._flip_code is not None
+            or config.swap_rb
+        )
+
     @property
     def device_id(self) -> Union[int, str]:
         return self._opencv_config.device_id
@@ -106,26 +295,19 @@ class OpenCVSource(ObservationSource):
     @property
     def is_rtsp(self) -> bool:
         """Check if this is an RTSP stream."""
-        return isinstance(self.device_id, str) and (
-            self.device_id.startswith("rtsp://") or 
-            self.device_id.startswith("rtsps://")
-        )
+        return self._is_rtsp
 
     @property
     def is_file(self) -> bool:
         """Check if this is a video file."""
-        return (
-            isinstance(self.device_id, str) and 
-            not self.is_rtsp and 
-            os.path.exists(self.device_id)
-        )
+        return self._is_file
 
     def open(self) -> None:
         """Open the video source."""
         if self._is_open:
             return
         
-        self._initialize(retry_count=0)
+        self._initialize()
         self._is_open = True
         self._frame_index = 0
         self._start_time = time.time()
@@ -135,73 +317,216 @@ class OpenCVSource(ObservationSource):
             f"device={sanitize_url(self.device_id)}, resolution={self._opencv_config.resolution}"
         )
 
-    def _initialize(self, retry_count: int = 0) -> None:
-        """Initialize or reinitialize the capture device."""
+    def _initialize(self) -> None:
+        """Initialize or reinitialize the capture device.
+
+        Retries with exponential backoff in a flat loop (bounded by
+        max_retries) rather than by recursing, so a long outage cannot
+        grow the call stack and the retry state is all in one frame.
+        """
+        self._stop_grab_thread()
         if self._cap is not None:
             self._cap.release()
             self._cap = None
 
-        if retry_count > 0:
-            wait_time = min(2 ** retry_count, 10)
-            logging.info(
-                f"Retrying initialization (attempt {retry_count + 1}/"
-                f"{self._opencv_config.max_retries}) after {wait_time}s"
-            )
-            time.sleep(wait_time)
-
-        # Set RTSP transport for FFmpeg
+        # Configure FFmpeg for low-latency RTSP: disable its probe/analysis
+        # buffering and RTP reorder queue, which are the usual cause of
+        # multi-second lag on live streams, and bound the socket timeout so
+        # a dead camera fails fast instead of hanging the open.
+        ffmpeg_opts = ""
         if self.is_rtsp:
             logging.info(f"Setting RTSP transport to: {self._opencv_config.rtsp_transport}")
-            os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = (
-                f"rtsp_transport;{self._opencv_config.rtsp_transport}"
-            )
+            ffmpeg_opts = "|".join([
+                f"rtsp_transport;{self._opencv_config.rtsp_transport}",
+                "fflags;nobuffer",
+                "flags;low_delay",
+                "reorder_queue_size;0",
+                "max_delay;0",
+                "stimeout;5000000",
+            ])
+
+        max_retries = self._opencv_config.max_retries
+        for attempt in range(max_retries):
+            if attempt > 0:
+                wait_time = min(2 ** attempt, 10)
+                logging.info(
+                    f"Retrying initialization (attempt {attempt + 1}/"
+                    f"{max_retries}) after {wait_time}s"
+                )
+                time.sleep(wait_time)
+
+            if self.is_rtsp:
+                # Pin the FFmpeg backend so the options above are guaranteed
+                # to apply (auto-selection could pick GStreamer, which
+                # ignores them)
+                self._cap = _open_ffmpeg_capture(self.device_id, ffmpeg_opts)
+            elif self._gst_pipeline is not None:
+                self._cap = cv2.VideoCapture(self._gst_pipeline, cv2.CAP_GSTREAMER)
+            else:
+                self._cap = cv2.VideoCapture(self.device_id, self._backend)
 
-        self._cap = cv2.VideoCapture(self.device_id)
+            if self._cap.isOpened():
+                break
 
-        if not self._cap.isOpened():
-            if retry_count < self._opencv_config.max_retries - 1:
+            self._cap.release()
+            self._cap = None
+            if attempt < max_retries - 1:
                 logging.warning(f"Failed to open device {sanitize_url(self.device_id)}, retrying...")
-                return self._initialize(retry_count + 1)
+        else:
             raise RuntimeError(
                 f"Failed to open device {sanitize_url(self.device_id)} after "
-                f"{self._opencv_config.max_retries} attempts"
+                f"{max_retries} attempts"
             )
 
         # Set properties for USB cameras (not streams/files)
-        if isinstance(self.device_id, int) and self._opencv_config.resolution:
+        # GStreamer pipelines fix format/size/fps in the caps string, so the
+        # CAP_PROP negotiation below only applies to the V4L2/ANY path.
+        if self._is_usb and self._opencv_config.resolution and self._gst_pipeline is None:
+            # Request the pixel format before resolution/fps so the driver
+            # allocates the right pipeline up front. MJPG moves ~1/10 the
+            # bytes of YUYV over USB, which is what makes 30 fps at 1080p
+            # achievable on most webcams.
+            if self._opencv_config.fourcc:
+                self._cap.set(
+                    _CAP_PROP_FOURCC,
+                    cv2.VideoWriter_fourcc(*self._opencv_config.fourcc),
+                )
             w, h = self._opencv_config.resolution
-            self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, w)
-            self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, h)
+            self._cap.set(_CAP_PROP_FRAME_WIDTH, w)
+            self._cap.set(_CAP_PROP_FRAME_HEIGHT, h)
             if self._opencv_config.fps:
-                self._cap.set(cv2.CAP_PROP_FPS, self._opencv_config.fps)
-            self._cap.set(cv2.CAP_PROP_BUFFERSIZE, self._opencv_config.buffer_size)
+                self._cap.set(_CAP_PROP_FPS, self._opencv_config.fps)
+            # Not all backends honour BUFFERSIZE (V4L2 does, DSHOW/MSMF
+            # often don't); warn when it was refused so latency reports
+            # against this camera aren't chased into the wrong layer.
+            if not self._cap.set(_CAP_PROP_BUFFERSIZE, self._opencv_config.buffer_size):
+                logging.warning(
+                    "Backend ignored CAP_PROP_BUFFERSIZE=%s; capture may buffer extra frames",
+                    self._opencv_config.buffer_size,
+                )
 
-            actual_w = self._cap.get(cv2.CAP_PROP_FRAME_WIDTH)
-            actual_h = self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
-            actual_fps = self._cap.get(cv2.CAP_PROP_FPS)
+            actual_w = self._cap.get(_CAP_PROP_FRAME_WIDTH)
+            actual_h = self._cap.get(_CAP_PROP_FRAME_HEIGHT)
+            actual_fps = self._cap.get(_CAP_PROP_FPS)
             logging.info(
                 f"Camera actual settings - Resolution: ({actual_w}x{actual_h}), FPS: {actual_fps}"
             )
         
-        # Brief warmup for cameras
+        # Warm up cameras by polling for the first frame instead of a fixed
+        # sleep: a fast camera is ready in tens of ms (the old 0.5s sleep
+        # was pure latency), while a slow RTSP negotiation gets up to the
+        # full deadline before we give up waiting.
         if not self.is_file:
-            time.sleep(0.5)
-        
+            deadline = time.monotonic() + 2.0
+            while time.monotonic() < deadline:
+                if self._cap.grab():
+                    break
+                time.sleep(0.02)
+            else:
+                logging.warning("Camera produced no frame during warmup window")
+
         self._consecutive_failures = 0
 
+        # Snapshot the negotiated properties once: each cap.get() is a
+        # round-trip into the backend (V4L2 ioctl / AVFormatContext query)
+        # and the values cannot change until the next (re)initialize.
+        self._video_info = {
+            "width": int(self._cap.get(_CAP_PROP_FRAME_WIDTH)),
+            "height": int(self._cap.get(_CAP_PROP_FRAME_HEIGHT)),
+            "fps": self._cap.get(_CAP_PROP_FPS),
+            "frame_count": int(self._cap.get(_CAP_PROP_FRAME_COUNT)) if self.is_file else None,
+            "fourcc": int(self._cap.get(_CAP_PROP_FOURCC)),
+        }
+
+        # Live sources get a grabber thread; files read synchronously so
+        # every frame is processed (dropping frames from a file is a bug,
+        # dropping stale frames from a live feed is the point).
+        if not self.is_file:
+            self._start_grab_thread()
+
+    def _start_grab_thread(self) -> None:
+        """Start the background grabber for live sources."""
+        self._stop_grabber = threading.Event()
+        self._new_frame.clear()
+        with self._frame_lock:
+            self._latest = None
+        self._grabber = threading.Thread(
+            target=self._grab_loop,
+            args=(self._cap, self._stop_grabber),
+            name=f"opencv-grabber-{self.source_id}",
+            daemon=True,
+        )
+        self._grabber.start()
+
+    def _stop_grab_thread(self) -> None:
+        """Stop the background grabber, if running."""
+        if self._grabber is None:
+            return
+        self._stop_grabber.set()
+        self._grabber.join(timeout=2.0)
+        self._grabber = None
+
+    def _grab_loop(self, cap: "cv2.VideoCapture", stop: threading.Event) -> None:
+        """Continuously pull frames into the single latest-frame slot."""
+        self._pin_to_capture_cpu()
+        while not stop.is_set():
+            if cap.grab():
+                ret, frame = cap.retrieve()
+                with self._frame_lock:
+                    self._latest = (ret, frame)
+                self._new_frame.set()
+            else:
+                # Publish the failure so read() can run its reconnect
+                # logic, and back off briefly to avoid spinning on a
+                # dead device.
+                with self._frame_lock:
+                    self._latest = (False, None)
+                self._new_frame.set()
+                time.sleep(0.05)
+
+    def _pin_to_capture_cpu(self) -> None:
+        """Pin the calling (grabber) thread to one core, where supported.
+
+        Keeps the frame decode/copy working set resident in a single
+        core's cache on multi-core embedded boards instead of migrating
+        under the inference threads. pid 0 targets the calling thread;
+        no-op on platforms without sched_setaffinity.
+        """
+        if not hasattr(os, "sched_setaffinity"):
+            return
+        cpu = self._opencv_config.capture_cpu
+        if cpu is None:
+            cpu = (os.cpu_count() or 1) - 1
+            if cpu == 0:
+                # Single core: nothing to isolate
+                return
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except (OSError, ValueError):
+            logging.warning("Could not pin grabber thread to CPU %s", cpu)
+
+    def _read_raw(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """Fetch the next frame: latest-slot for live sources, cap.read() for files."""
+        if self._grabber is None:
+            return self._cap.read()
+        self._new_frame.wait(timeout=1.0)
+        self._new_frame.clear()
+        with self._frame_lock:
+            latest = self._latest
+        if latest is None:
+            return False, None
+        return latest
+
     def read(self) -> Optional[FrameData]:
         """Read the next frame from the source."""
+        # Cheap Python-flag check only; the old per-frame cap.isOpened()
+        # crossed into OpenCV on every call for a state that the failure
+        # branch below already detects (a closed capture makes _read_raw
+        # return False, which triggers the same reinitialize).
         if not self._is_open or self._cap is None:
             return None
 
-        if not self._cap.isOpened():
-            logging.warning("Capture not opened, attempting to reinitialize")
-            try:
-                self._initialize()
-            except RuntimeError:
-                return None
-
-        ret, frame = self._cap.read()
+        ret, frame = self._read_raw()
 
         if not ret or frame is None:
             self._consecutive_failures += 1
@@ -211,26 +536,49 @@ class OpenCVSource(ObservationSource):
                 logging.info("End of video file reached")
                 return None
             
+            # Below the transport's threshold, skip the expensive reopen
+            # and let the backend recover on its own
+            if self._consecutive_failures < self._reinit_fail_threshold:
+                self._log_rate_limited(
+                    "read_fail", logging.WARNING,
+                    "Failed to read frame (failures: %d), waiting for stream to recover",
+                    self._consecutive_failures,
+                )
+                return None
+
             # For cameras, try to reconnect
-            if self._consecutive_failures <= 3:
-                logging.warning(
-                    f"Failed to read frame (failures: {self._consecutive_failures}), reinitializing..."
+            if self._consecutive_failures <= self._reinit_fail_threshold + 3:
+                self._log_rate_limited(
+                    "read_fail_reinit", logging.WARNING,
+                    "Failed to read frame (failures: %d), reinitializing...",
+                    self._consecutive_failures,
                 )
                 try:
                     self._initialize()
-                    ret, frame = self._cap.read()
-                    if not ret or frame is None:
+                    # The first frame after a V4L2/RTSP reopen is often
+                    # stale pre-roll left over from before the failure;
+                    # discard one before accepting, and reject an
+                    # all-black frame (common garbage-first-frame mode)
+                    self._read_raw()
+                    ret, frame = self._read_raw()
+                    if not ret or frame is None or not frame.any():
                         return None
                     self._consecutive_failures = 0
                 except RuntimeError:
-                    logging.error("Reinitialization failed")
+                    self._log_rate_limited(
+                        "reinit_fail", logging.ERROR, "Reinitialization failed"
+                    )
                     return None
             else:
-                logging.error("Too many consecutive read failures")
+                self._log_rate_limited(
+                    "read_giveup", logging.ERROR, "Too many consecutive read failures"
+                )
                 return None
 
-        # Apply post-processing transforms
-        frame = self._apply_transforms(frame)
+        # Apply post-processing transforms (skipped entirely when none are
+        # configured, the common case)
+        if self._has_transforms:
+            frame = self._apply_transforms(frame)
 
         # Create FrameData
         timestamp = time.time()
@@ -245,52 +593,88 @@ class OpenCVSource(ObservationSource):
             source=self.source_id,
         )
 
+    def _log_rate_limited(self, key: str, level: int, msg: str, *args: Any) -> None:
+        """Emit a log record at most once per second per message key.
+
+        A flapping stream fails on every frame; at 30 fps unthrottled
+        warnings mean thousands of records per second through logging's
+        lock right when the pipeline most needs to keep moving. %-style
+        args defer formatting to the records that actually get emitted.
+        """
+        now = time.monotonic()
+        if now - self._log_times.get(key, 0.0) >= 1.0:
+            self._log_times[key] = now
+            logging.log(level, msg, *args)
+
+    def read_into(self, out: np.ndarray) -> bool:
+        """Read the next raw frame into a caller-owned buffer.
+
+        Zero-allocation variant of read() for tight loops: cap.retrieve()
+        reuses the storage of a contiguous uint8 (H, W, 3) array instead of
+        allocating a fresh ndarray per frame (~180 MB/s of malloc/free
+        traffic at 1080p30). Skips the transform plan and FrameData
+        wrapping — callers that need those use read().
+
+        Must not be used while the grabber thread is running (live
+        sources): cv2.VideoCapture is not thread-safe, and the grabber
+        calls grab()/retrieve() on the same handle. Only file sources,
+        which stay synchronous, may use this.
+
+        Args:
+            out: Preallocated contiguous array matching the source's
+                frame shape and dtype.
+
+        Returns:
+            True if a frame was decoded into ``out``.
+
+        Raises:
+            RuntimeError: If called while the grabber thread is running.
+        """
+        if self._grabber is not None:
+            raise RuntimeError(
+                "read_into() cannot be used on live sources: the grabber "
+                "thread owns the capture handle; use read() instead"
+            )
+        if not self._is_open or self._cap is None:
+            return False
+        if not self._cap.grab():
+            return False
+        ok, _ = self._cap.retrieve(out)
+        return ok
+
     def _apply_transforms(self, frame: np.ndarray) -> np.ndarray:
-        """Apply configured image transforms (rotate, flip, swap_rb)."""
-        cfg = self._opencv_config
-
-        # Rotation
-        if cfg.rotate == 90:
-            frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
-        elif cfg.rotate == 180:
-            frame = cv2.rotate(frame, cv2.ROTATE_180)
-        elif cfg.rotate == 270:
-            frame = cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
-
-        # Flip
-        if cfg.flip_horizontal or cfg.flip_vertical:
-            if cfg.flip_horizontal and cfg.flip_vertical:
-                flip_code = -1
-            elif cfg.flip_horizontal:
-                flip_code = 1
-            else:
-                flip_code = 0
-            frame = cv2.flip(frame, flip_code)
+        """Apply the precomputed transform plan (rotate, flip, swap_rb)."""
+        if self._rotate_code is not None:
+            frame = cv2.rotate(frame, self._rotate_code)
 
-        # Color channel swap (RGB <-> BGR)
-        if cfg.swap_rb:
-            frame = frame[..., ::-1].copy()
+        if self._flip_code is not None:
+            frame = cv2.flip(frame, self._flip_code)
+
+        # Color channel swap (RGB <-> BGR): cvtColor is a single SIMD pass,
+        # unlike the strided-view copy frame[..., ::-1].copy()
+        if self._opencv_config.swap_rb:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
         return frame
 
     def close(self) -> None:
         """Close the video source and release resources."""
+        self._stop_grab_thread()
         if self._cap is not None:
             self._cap.release()
             self._cap = None
+        self._video_info = {}
         self._is_open = False
         logging.info(f"OpenCVSource closed: source_id={self.source_id}")
 
     def get_video_info(self) -> Dict[str, Any]:
-        """Get information about the video source (for files)."""
-        if self._cap is None or not self._cap.isOpened():
+        """Get information about the video source (for files).
+
+        Served from the snapshot taken in _initialize(), so dashboards
+        polling this per frame cost a dict copy instead of five backend
+        property queries.
+        """
+        if self._cap is None:
             return {}
-        
-        return {
-            "width": int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
-            "height": int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
-            "fps": self._cap.get(cv2.CAP_PROP_FPS),
-            "frame_count": int(self._cap.get(cv2.CAP_PROP_FRAME_COUNT)) if self.is_file else None,
-            "fourcc": int(self._cap.get(cv2.CAP_PROP_FOURCC)),
-        }
+        return dict(self._video_info)
 
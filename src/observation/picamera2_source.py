@@ -74,11 +74,48 @@ class Picamera2Source(ObservationSource):
                 process(frame_data.frame)
     """
 
+    __slots__ = (
+        "_picam_config",
+        "_picam2",
+        "_start_time",
+        "_needs_rb_swap",
+        "_rotate_degrees",
+        "_flip_code",
+        "_has_transforms",
+    )
+
     def __init__(self, config: Picamera2SourceConfig):
         super().__init__(config)
         self._picam_config = config
         self._picam2: Any = None
         self._start_time: Optional[float] = None
+        self._needs_rb_swap = False
+
+        # Transform plan resolved once: fold rotate-180 into the flip pass
+        # (same pixel permutation as flipping both axes) and precompute the
+        # flip code. Rotation is kept in degrees so cv2 can stay a lazy
+        # import; _apply_transforms maps it to a cv2.ROTATE_* code.
+        rotate = config.rotate
+        flip_h = config.flip_horizontal
+        flip_v = config.flip_vertical
+        if rotate == 180:
+            flip_h = not flip_h
+            flip_v = not flip_v
+            rotate = 0
+        self._rotate_degrees = rotate
+        if flip_h and flip_v:
+            self._flip_code: Optional[int] = -1
+        elif flip_h:
+            self._flip_code = 1
+        elif flip_v:
+            self._flip_code = 0
+        else:
+            self._flip_code = None
+        self._has_transforms = (
+            self._rotate_degrees != 0
+            or self._flip_code is not None
+            or config.swap_rb
+        )
 
     def open(self) -> None:
         """Open the Picamera2 source."""
@@ -99,11 +136,28 @@ class Picamera2Source(ObservationSource):
         resolution = self._picam_config.resolution or (1280, 720)
         fps = self._picam_config.fps or 30
         
-        video_config = self._picam2.create_video_configuration(
-            main={"size": resolution, "format": "RGB888"},
-            controls={"FrameRate": fps},
-        )
-        self._picam2.configure(video_config)
+        # Negotiate the channel order at configure time so read() can hand
+        # the capture buffer straight through with no per-frame swap.
+        # Note picamera2 names formats opposite to their memory order:
+        # "BGR888" yields the byte order the old RGB888-then-swap path
+        # produced. Fall back to that path if the format is rejected.
+        self._needs_rb_swap = False
+        try:
+            video_config = self._picam2.create_video_configuration(
+                main={"size": resolution, "format": "BGR888"},
+                controls={"FrameRate": fps},
+            )
+            self._picam2.configure(video_config)
+        except Exception:
+            logging.warning(
+                "BGR888 not accepted by camera, falling back to RGB888 with per-frame swap"
+            )
+            video_config = self._picam2.create_video_configuration(
+                main={"size": resolution, "format": "RGB888"},
+                controls={"FrameRate": fps},
+            )
+            self._picam2.configure(video_config)
+            self._needs_rb_swap = True
         self._picam2.start()
         
         self._is_open = True
@@ -121,14 +175,17 @@ class Picamera2Source(ObservationSource):
             return None
 
         try:
-            # Capture frame (RGB888 format)
-            frame_rgb = self._picam2.capture_array("main")
+            # Capture frame; with BGR888 negotiated at configure time the
+            # buffer is already in OpenCV channel order
+            frame_bgr = self._picam2.capture_array("main")
+            if self._needs_rb_swap:
+                frame_bgr = self._rgb_to_bgr(frame_bgr)
             
-            # Convert RGB to BGR (for OpenCV compatibility)
-            frame_bgr = frame_rgb[..., ::-1].copy()
-            
-            # Apply post-processing transforms
-            frame = self._apply_transforms(frame_bgr)
+            # Apply post-processing transforms (skipped entirely when none
+            # are configured, the common case)
+            frame = (
+                self._apply_transforms(frame_bgr) if self._has_transforms else frame_bgr
+            )
             
             # Create FrameData
             timestamp = time.time()
@@ -146,6 +203,16 @@ class Picamera2Source(ObservationSource):
             logging.error(f"Error capturing frame from Picamera2: {e}")
             return None
 
+    @staticmethod
+    def _rgb_to_bgr(frame_rgb: np.ndarray) -> np.ndarray:
+        """Swap R/B channels, preferring OpenCV's SIMD cvtColor pass."""
+        try:
+            import cv2
+        except ImportError:
+            # Strided-view copy fallback when cv2 is absent
+            return frame_rgb[..., ::-1].copy()
+        return cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGR)
+
     def _apply_transforms(self, frame: np.ndarray) -> np.ndarray:
         """Apply configured image transforms (rotate, flip, swap_rb)."""
         try:
@@ -154,29 +221,19 @@ class Picamera2Source(ObservationSource):
             logging.warning("cv2 not available for transforms")
             return frame
             
-        cfg = self._picam_config
-
-        # Rotation
-        if cfg.rotate == 90:
+        # Rotation (precomputed plan; 180 was folded into the flip pass)
+        if self._rotate_degrees == 90:
             frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
-        elif cfg.rotate == 180:
-            frame = cv2.rotate(frame, cv2.ROTATE_180)
-        elif cfg.rotate == 270:
+        elif self._rotate_degrees == 270:
             frame = cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
 
-        # Flip
-        if cfg.flip_horizontal or cfg.flip_vertical:
-            if cfg.flip_horizontal and cfg.flip_vertical:
-                flip_code = -1
-            elif cfg.flip_horizontal:
-                flip_code = 1
-            else:
-                flip_code = 0
-            frame = cv2.flip(frame, flip_code)
-
-        # Color channel swap (swap back to RGB if needed)
-        if cfg.swap_rb:
-            frame = frame[..., ::-1].copy()
+        if self._flip_code is not None:
+            frame = cv2.flip(frame, self._flip_code)
+
+        # Color channel swap (swap back to RGB if needed): cvtColor is a
+        # single SIMD pass, unlike the strided-view copy
+        if self._picam_config.swap_rb:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
         return frame
 
@@ -10,11 +10,31 @@ from __future__ import annotations
 import logging
 import os
 import re
+from functools import lru_cache
 from typing import Any, Dict, Union
 from urllib.parse import urlparse, urlunparse
 
 import yaml
 
+# Prefer the libyaml C loader when PyYAML was built with it; the pure-Python
+# parser is an order of magnitude slower, which shows up as a stall on every
+# camera (re)connect that re-reads the secrets file.
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader  # type: ignore
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader  # type: ignore
+
+
+@lru_cache(maxsize=4)
+def _load_secrets(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a secrets YAML file, cached per (path, mtime).
+
+    Reconnects and tests re-read the same unchanged file; keying on mtime
+    means edits still take effect while repeat loads skip the parse.
+    """
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YamlSafeLoader) or {}
+
 
 def sanitize_url(url: Union[str, int]) -> str:
     """
@@ -66,9 +86,9 @@ def inject_rtsp_credentials(camera_cfg: Dict[str, Any]) -> None:
         return
     
     try:
-        with open(secrets_file, "r") as f:
-            secrets = yaml.safe_load(f) or {}
-        
+        secrets = _load_secrets(secrets_file, os.path.getmtime(secrets_file))
+
+
         username = secrets.get("username")
         password = secrets.get("password")
         rtsp_url_from_secrets = secrets.get("rtsp_url")
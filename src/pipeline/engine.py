@@ -249,7 +249,12 @@ class PipelineEngine:
                 f"Vehicle {event.track_id} counted: direction={direction}, "
                 f"total={self.stats.vehicle_count}"
             )
-        
+
+        # Nudge the sync worker so fresh counts upload promptly instead of
+        # waiting out its poll backoff
+        if events and self.ctx.cloud_sync and hasattr(self.ctx.cloud_sync, "wake_event"):
+            self.ctx.cloud_sync.wake_event.set()
+
         # Draw overlays
         annotated_frame = self._draw_overlays(frame.copy())
         
@@ -13,7 +13,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from models.count_event import CountEvent
 from algorithms.counting.base import Counter
@@ -140,16 +140,18 @@ class MeasureStage:
         if self._frame_size:
             self.ensure_counter(*self._frame_size)
 
-    def process(self, tracks: List[Any], frame_idx: int) -> List[CountEvent]:
+    def process(self, tracks: List[Any], frame_idx: int) -> Sequence[CountEvent]:
         """
         Process tracks and produce count events.
-        
+
         Args:
             tracks: List of track objects from the tracker.
             frame_idx: Current frame index.
-            
+
         Returns:
-            List of CountEvent objects for this frame.
+            Sequence of CountEvent objects for this frame; forwards the
+            counter's result, which may be an immutable shared empty
+            sequence, so callers must not mutate it.
         """
         if self._counter is None:
             return []
@@ -164,23 +166,28 @@ class MeasureStage:
         events = self._counter.process(tracks, frame_idx)
         
         # Persist events
-        for event in events:
-            self._persist_event(event)
-        
+        self._persist_events(events)
+
         return events
 
-    def _persist_event(self, event: CountEvent) -> None:
-        """Persist a count event to the database."""
-        if not self._config.persist_events:
+    def _persist_events(self, events: Sequence[CountEvent]) -> None:
+        """Persist this frame's count events to the database in one batch."""
+        if not events or not self._config.persist_events:
             return
-        
+
         if self._db is None:
             return
-        
+
         try:
-            self._db.add_count_event(event)
+            # One transaction per frame's worth of events instead of one
+            # commit (fsync) per event
+            if hasattr(self._db, "add_count_events"):
+                self._db.add_count_events(events)
+            else:
+                for event in events:
+                    self._db.add_count_event(event)
         except Exception as e:
-            logging.error(f"Failed to persist count event: {e}")
+            logging.error(f"Failed to persist count events: {e}")
 
     def get_lines(self) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """Get counting lines for visualization."""
@@ -146,8 +146,12 @@ class Database:
         cursor.execute(
             "CREATE INDEX idx_count_events_direction ON count_events(direction_code)"
         )
+        # Partial index: restricted to the unsynced tail, so the cloud
+        # sync's WHERE cloud_synced = 0 ORDER BY id scan stays
+        # O(unsynced) even when millions of synced rows accumulate
         cursor.execute(
-            "CREATE INDEX idx_count_events_cloud_synced ON count_events(cloud_synced)"
+            "CREATE INDEX idx_count_events_unsynced "
+            "ON count_events(id) WHERE cloud_synced = 0"
         )
         cursor.execute(
             "CREATE INDEX idx_count_events_class ON count_events(class_name)"
@@ -155,6 +159,16 @@ class Database:
         cursor.execute(
             "CREATE INDEX idx_count_events_backend ON count_events(detection_backend)"
         )
+
+        # Performance indexes (also retrofitted onto existing databases
+        # by _ensure_indexes, so these must stay in sync with that list)
+        cursor.execute(
+            "CREATE INDEX idx_count_events_ts_desc ON count_events(ts DESC)"
+        )
+        cursor.execute(
+            "CREATE INDEX idx_count_events_class_conf "
+            "ON count_events(class_name, confidence)"
+        )
         
         # Defense-in-depth: prevent duplicate counts for same track within same second
         # This catches edge cases where the counting logic might emit duplicates
@@ -197,71 +211,109 @@ class Database:
                 self._create_schema()
             else:
                 logging.info(f"Schema version {current_version} is current")
-            
+                self._ensure_indexes()
+
         except sqlite3.Error as e:
             logging.error(f"Database initialization error: {e}")
             raise
+
+    def _ensure_indexes(self) -> None:
+        """
+        Retrofit performance indexes onto an existing database.
+
+        Indexes added after a schema version shipped are created here with
+        IF NOT EXISTS so existing databases pick them up without a
+        destructive schema-version migration.
+        """
+        cursor = self._get_connection().cursor()
+
+        # ts DESC serves "recent events" queries (ORDER BY ts DESC LIMIT n)
+        # without a sort; (class_name, confidence) is covering for the
+        # per-class count/AVG(confidence) aggregates.
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_count_events_ts_desc "
+            "ON count_events(ts DESC)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_count_events_class_conf "
+            "ON count_events(class_name, confidence)"
+        )
+
+        # The partial unsynced index supersedes the old full cloud_synced
+        # index: smaller (only unsynced rows) and more selective for the
+        # sync query's exact WHERE clause.
+        cursor.execute("DROP INDEX IF EXISTS idx_count_events_cloud_synced")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_count_events_unsynced "
+            "ON count_events(id) WHERE cloud_synced = 0"
+        )
+
+        self._get_connection().commit()
     
     # -------------------------------------------------------------------------
     # Write Operations
     # -------------------------------------------------------------------------
     
+    _INSERT_COUNT_EVENT_SQL = """
+        INSERT INTO count_events (
+            ts, frame_idx, track_id, direction_code, direction_label,
+            gate_sequence, line_a_cross_frame, line_b_cross_frame,
+            track_age_frames, track_displacement_px,
+            class_id, class_name, confidence,
+            detection_backend, platform, process_pid,
+            cloud_synced
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+    """
+
+    @staticmethod
+    def _event_row(event: CountEvent) -> Tuple:
+        """Build the parameter tuple for inserting a CountEvent."""
+        # Convert timestamp to epoch milliseconds
+        ts_ms = int(event.timestamp * 1000)
+
+        # Determine gate sequence from direction
+        if event.gate_sequence:
+            if event.direction == "A_TO_B":
+                gate_seq = "A,B"
+            elif event.direction == "B_TO_A":
+                gate_seq = "B,A"
+            else:
+                gate_seq = event.gate_sequence
+        else:
+            gate_seq = None
+
+        return (
+            ts_ms,
+            event.line_a_cross_frame,  # Use line_a_cross_frame as frame_idx proxy
+            event.track_id,
+            event.direction,
+            event.direction_label,
+            gate_seq,
+            event.line_a_cross_frame,
+            event.line_b_cross_frame,
+            event.track_age_frames,
+            event.track_displacement_px,
+            event.class_id,
+            event.class_name,
+            event.confidence,
+            event.detection_backend,
+            event.platform,
+            event.process_pid,
+        )
+
     def add_count_event(self, event: CountEvent) -> Optional[int]:
         """
         Add a count event to the database.
-        
+
         Args:
             event: CountEvent from the counter.
-            
+
         Returns:
             ID of the inserted record, or None on error.
         """
         try:
             cursor = self._get_connection().cursor()
-            
-            # Convert timestamp to epoch milliseconds
-            ts_ms = int(event.timestamp * 1000)
-            
-            # Determine gate sequence from direction
-            if event.gate_sequence:
-                gate_seq = event.gate_sequence.replace("_TO_", ",").replace("A,B", "A,B").replace("B,A", "B,A")
-                if event.direction == "A_TO_B":
-                    gate_seq = "A,B"
-                elif event.direction == "B_TO_A":
-                    gate_seq = "B,A"
-                else:
-                    gate_seq = event.gate_sequence
-            else:
-                gate_seq = None
-            
-            cursor.execute("""
-                INSERT INTO count_events (
-                    ts, frame_idx, track_id, direction_code, direction_label,
-                    gate_sequence, line_a_cross_frame, line_b_cross_frame,
-                    track_age_frames, track_displacement_px,
-                    class_id, class_name, confidence,
-                    detection_backend, platform, process_pid,
-                    cloud_synced
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
-            """, (
-                ts_ms,
-                event.line_a_cross_frame,  # Use line_a_cross_frame as frame_idx proxy
-                event.track_id,
-                event.direction,
-                event.direction_label,
-                gate_seq,
-                event.line_a_cross_frame,
-                event.line_b_cross_frame,
-                event.track_age_frames,
-                event.track_displacement_px,
-                event.class_id,
-                event.class_name,
-                event.confidence,
-                event.detection_backend,
-                event.platform,
-                event.process_pid,
-            ))
-            
+            cursor.execute(self._INSERT_COUNT_EVENT_SQL, self._event_row(event))
             self._get_connection().commit()
             
             logging.debug(
@@ -281,7 +333,51 @@ class Database:
         except sqlite3.Error as e:
             logging.error(f"Error adding count event: {e}")
             return None
-    
+
+    def add_count_events(self, events: List[CountEvent]) -> int:
+        """
+        Add a batch of count events in a single transaction.
+
+        Amortizes the per-commit fsync across the whole batch; with many
+        events per flush this is substantially faster than committing each
+        event individually.
+
+        Args:
+            events: CountEvents from the counter.
+
+        Returns:
+            Number of events actually inserted.
+        """
+        if not events:
+            return 0
+
+        if len(events) == 1:
+            return 1 if self.add_count_event(events[0]) is not None else 0
+
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.executemany(
+                self._INSERT_COUNT_EVENT_SQL,
+                [self._event_row(event) for event in events],
+            )
+            conn.commit()
+            return len(events)
+        except sqlite3.IntegrityError:
+            # A duplicate aborts the whole executemany; retry row by row so
+            # only the duplicates are rejected (same semantics as the
+            # single-event path).
+            conn.rollback()
+            inserted = 0
+            for event in events:
+                if self.add_count_event(event) is not None:
+                    inserted += 1
+            return inserted
+        except sqlite3.Error as e:
+            logging.error(f"Error adding count events: {e}")
+            conn.rollback()
+            return 0
+
     def add_vehicle_detection(
         self, 
         timestamp: float, 
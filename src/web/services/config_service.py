@@ -1,10 +1,37 @@
 from __future__ import annotations
 
+import copy
 import os
+from functools import lru_cache
 from typing import Any, Dict
 
 import yaml
 
+# Prefer the libyaml C loader when available; the pure-Python parser is an
+# order of magnitude slower, which adds up when the web UI reloads the
+# config layers on every settings request.
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader  # type: ignore
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader  # type: ignore
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file, cached per (path, mtime_ns)."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YamlSafeLoader) or {}
+
+
+def _load_yaml(path: str) -> Dict[str, Any]:
+    """Load a YAML file through the mtime-keyed cache.
+
+    Returns a deep copy because callers merge the layers in place; the
+    cached parse must stay pristine for the next request.
+    """
+    st = os.stat(path)
+    return copy.deepcopy(_parse_yaml(path, st.st_mtime_ns))
+
 
 class ConfigService:
     """
@@ -33,15 +60,13 @@ class ConfigService:
     def load_default() -> Dict[str, Any]:
         if not os.path.exists(ConfigService.DEFAULT_PATH):
             return {}
-        with open(ConfigService.DEFAULT_PATH, "r") as f:
-            return yaml.safe_load(f) or {}
+        return _load_yaml(ConfigService.DEFAULT_PATH)
 
     @staticmethod
     def load_overrides() -> Dict[str, Any]:
         if not os.path.exists(ConfigService.OVERRIDES_PATH):
             return {}
-        with open(ConfigService.OVERRIDES_PATH, "r") as f:
-            return yaml.safe_load(f) or {}
+        return _load_yaml(ConfigService.OVERRIDES_PATH)
 
     @staticmethod
     def load_effective_config() -> Dict[str, Any]:
@@ -19,8 +19,8 @@ from algorithms.counting.gate import (
     GateCounterConfig,
     crossed_line as gate_crossed_line,
     _side_of_line,
-    _distance,
 )
+from algorithms.counting.geometry import _distance
 
 
 @dataclass
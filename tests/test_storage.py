@@ -156,6 +156,52 @@ class TestSchemaCreation:
         db2.close()
 
 
+class TestIndexRetrofit:
+    """Tests for retrofitting indexes onto existing current-version DBs."""
+
+    def test_retrofit_replaces_cloud_synced_index(self, temp_db):
+        """Reopening an old DB swaps the full cloud_synced index for the partial one."""
+        # Build a current-version DB, then rewind its indexes to the
+        # pre-retrofit state
+        db = Database(temp_db)
+        db.initialize()
+        db.close()
+
+        conn = sqlite3.connect(temp_db)
+        cursor = conn.cursor()
+        cursor.execute("DROP INDEX idx_count_events_unsynced")
+        cursor.execute("DROP INDEX idx_count_events_ts_desc")
+        cursor.execute("DROP INDEX idx_count_events_class_conf")
+        cursor.execute(
+            "CREATE INDEX idx_count_events_cloud_synced ON count_events(cloud_synced)"
+        )
+        conn.commit()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        before = {row[0] for row in cursor.fetchall()}
+        conn.close()
+
+        assert "idx_count_events_cloud_synced" in before
+        assert "idx_count_events_unsynced" not in before
+
+        # Same schema version, so initialize() takes the _ensure_indexes
+        # branch instead of recreating the schema
+        db2 = Database(temp_db)
+        db2.initialize()
+        db2.close()
+
+        conn = sqlite3.connect(temp_db)
+        cursor = conn.cursor()
+        cursor.execute("SELECT name, sql FROM sqlite_master WHERE type='index'")
+        after = {row[0]: row[1] for row in cursor.fetchall()}
+        conn.close()
+
+        assert "idx_count_events_cloud_synced" not in after
+        assert "idx_count_events_unsynced" in after
+        assert "cloud_synced = 0" in after["idx_count_events_unsynced"]
+        assert "idx_count_events_ts_desc" in after
+        assert "idx_count_events_class_conf" in after
+
+
 class TestWriteOperations:
     """Tests for write operations."""
     
@@ -282,6 +328,70 @@ class TestWriteOperations:
         
         db.close()
     
+    def _make_event(self, track_id, timestamp):
+        """Build a minimal gate-mode event for batch tests."""
+        return CountEvent(
+            track_id=track_id,
+            direction="A_TO_B",
+            direction_label="northbound",
+            timestamp=timestamp,
+            counting_mode="gate",
+            gate_sequence="A,B",
+            line_a_cross_frame=10,
+            line_b_cross_frame=20,
+            track_age_frames=15,
+            track_displacement_px=100.0,
+        )
+
+    def test_add_count_events_batch(self, temp_db):
+        """Batch insert stores all events in one call."""
+        db = Database(temp_db)
+        db.initialize()
+
+        now = time.time()
+        events = [self._make_event(track_id=i, timestamp=now - i) for i in range(5)]
+
+        inserted = db.add_count_events(events)
+
+        assert inserted == 5
+        assert db.get_count_total() == 5
+
+        db.close()
+
+    def test_add_count_events_empty(self, temp_db):
+        """Empty batch is a no-op."""
+        db = Database(temp_db)
+        db.initialize()
+
+        assert db.add_count_events([]) == 0
+        assert db.get_count_total() == 0
+
+        db.close()
+
+    def test_add_count_events_duplicate_in_batch(self, temp_db):
+        """A duplicate in the batch drops only the duplicate, not the batch."""
+        db = Database(temp_db)
+        db.initialize()
+
+        # Floor to whole second so the two track-42 events land in the
+        # same second (unique index is on track_id, ts / 1000), and back
+        # off one second so the stamps are never in the future (the
+        # default get_count_total range ends at now)
+        ts = float(int(time.time())) - 1
+        events = [
+            self._make_event(track_id=42, timestamp=ts + 0.100),
+            self._make_event(track_id=42, timestamp=ts + 0.500),  # duplicate
+            self._make_event(track_id=43, timestamp=ts + 0.200),
+        ]
+
+        inserted = db.add_count_events(events)
+
+        # Only the duplicate is rejected; the rest of the batch survives
+        assert inserted == 2
+        assert db.get_count_total() == 2
+
+        db.close()
+
     def test_legacy_add_vehicle_detection(self, temp_db):
         """Legacy method still works."""
         db = Database(temp_db)